@@ -45,30 +45,28 @@ def demo_remote_change_detection():
         mock_repo = Mock()
         mock_repo_class.return_value = mock_repo
         
-        # Mock a tag and commits since tag on remote branch
-        mock_tag = Mock()
-        mock_tag.name = "1.0.0"
-        mock_tag.commit.committed_date = 1000
-        mock_tag.commit.hexsha = "abc123"
-        mock_repo.tags = [mock_tag]
+        # Mock a version tag, as listed by git for-each-ref
+        mock_repo.git.for_each_ref.return_value = "1.0.0"
         
-        # Simulate 8 new commits on remote main branch
-        mock_commits = [Mock() for _ in range(8)]
-        mock_repo.iter_commits.return_value = mock_commits
+        # Simulate 8 new commits on remote main branch, as counted by git rev-list
+        mock_repo.git.rev_list.return_value = "8"
         
         print("   📋 Scenario: Repository with new remote commits")
-        print("      - Last tag: 1.0.0 (commit: abc123)")
+        print("      - Last tag: 1.0.0")
         print("      - Checking: origin/main branch")
         
         # Test with remote reference
         count = manager.get_commits_since_last_tag(Path("/fake/repo"), "origin/main")
         
         print(f"      - Remote commits found: {count}")
-        print("      - GitPython call: repo.iter_commits('abc123..origin/main')")
+        print("      - Git call: git rev-list --count refs/tags/1.0.0..origin/main")
         print("      - Result: ✅ DETECTS REMOTE CHANGES")
         
         # Verify the correct call was made
-        mock_repo.iter_commits.assert_called_with("abc123..origin/main")
+        mock_repo.git.rev_list.assert_called_with('--count', 'refs/tags/1.0.0..origin/main')
+    
+    # Each scenario patches Repo afresh, so drop the repositories opened for this one
+    manager.close()
     
     print("\n🧪 Testing Release Preparation Integration:")
     
@@ -89,15 +87,10 @@ def demo_remote_change_detection():
         
         # Mock repository with remote changes
         mock_repo_class.return_value = mock_repo
-        mock_tag = Mock()
-        mock_tag.name = "2.1.0"
-        mock_tag.commit.committed_date = 2000
-        mock_tag.commit.hexsha = "def456"
-        mock_repo.tags = [mock_tag]
+        mock_repo.git.for_each_ref.return_value = "2.1.0"
         
         # Simulate 12 new commits on remote main
-        mock_commits = [Mock() for _ in range(12)]
-        mock_repo.iter_commits.return_value = mock_commits
+        mock_repo.git.rev_list.return_value = "12"
         
         # Create project configuration
         project = ProjectConfig(
@@ -127,7 +120,7 @@ def demo_remote_change_detection():
         
         # Verify the remote reference was used
         expected_call_found = False
-        for call_args in mock_repo.iter_commits.call_args_list:
+        for call_args in mock_repo.git.rev_list.call_args_list:
             if "origin/main" in str(call_args):
                 expected_call_found = True
                 break
@@ -137,6 +130,8 @@ def demo_remote_change_detection():
         else:
             print("      - ❌ Did not use remote branch reference")
     
+    manager.close()
+    
     print("\n🧪 Testing Custom Main Branch:")
     
     # Test 3: Custom main branch (e.g., develop)
@@ -156,11 +151,10 @@ def demo_remote_change_detection():
         
         # Mock repository
         mock_repo_class.return_value = mock_repo
-        mock_repo.tags = []  # No tags
+        mock_repo.git.for_each_ref.return_value = ""  # No tags
         
         # Simulate 5 commits on remote develop branch
-        mock_commits = [Mock() for _ in range(5)]
-        mock_repo.iter_commits.return_value = mock_commits
+        mock_repo.git.rev_list.return_value = "5"
         
         # Create project with custom main branch
         project = ProjectConfig(
@@ -183,7 +177,7 @@ def demo_remote_change_detection():
         
         # Verify origin/develop was used
         develop_call_found = False
-        for call_args in mock_repo.iter_commits.call_args_list:
+        for call_args in mock_repo.git.rev_list.call_args_list:
             if "origin/develop" in str(call_args):
                 develop_call_found = True
                 break
@@ -193,6 +187,8 @@ def demo_remote_change_detection():
         else:
             print("      - ❌ Did not use origin/develop reference")
     
+    manager.close()
+    
     print("\n🎉 Summary:")
     print("   ✅ Remote change detection now works correctly")
     print("   ✅ Uses origin/{main_branch} for accurate commit counting")
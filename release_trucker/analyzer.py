@@ -1,5 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 from git import Repo
 import logging
 import re
@@ -8,28 +9,48 @@ from .api_client import VersionInfo, ActuatorClient
 from .git_manager import GitManager
 
 
-@dataclass
+# JIRA ticket pattern: word-digits (e.g., ABC-123, PROJ-456)
+JIRA_TICKET_PATTERN = re.compile(r'\b([A-Z]{1,10}-\d+)\b')
+
+# Upper bound on concurrent actuator requests per project
+MAX_VERSION_FETCH_WORKERS = 8
+
+
+@dataclass(init=False)
 class EnvironmentCommits:
+    # Built per project and environment and read heavily by the report template, so skip
+    # the per-instance __dict__. Slotted fields can't carry class-level defaults, hence __init__.
+    __slots__ = ('environment', 'version', 'commit_id', 'commits', 'jira_tickets')
+    
     environment: str
     version: str
     commit_id: str
     commits: List[dict]
-    jira_tickets: Set[str] = None
+    jira_tickets: Set[str]
     
-    def __post_init__(self):
-        if self.jira_tickets is None:
-            self.jira_tickets = set()
+    def __init__(self, environment: str, version: str, commit_id: str, commits: List[dict],
+                 jira_tickets: Set[str] = None):
+        self.environment = environment
+        self.version = version
+        self.commit_id = commit_id
+        self.commits = commits
+        self.jira_tickets = set() if jira_tickets is None else jira_tickets
 
 
-@dataclass
+@dataclass(init=False)
 class ProjectAnalysis:
+    # One per project, slotted like EnvironmentCommits
+    __slots__ = ('project_name', 'environments', 'environment_order')
+    
     project_name: str
     environments: Dict[str, EnvironmentCommits]
-    environment_order: List[str] = None
+    environment_order: List[str]
     
-    def __post_init__(self):
-        if self.environment_order is None:
-            self.environment_order = ["DEV", "TEST", "PRE", "PROD"]
+    def __init__(self, project_name: str, environments: Dict[str, EnvironmentCommits],
+                 environment_order: List[str] = None):
+        self.project_name = project_name
+        self.environments = environments
+        self.environment_order = ["DEV", "TEST", "PRE", "PROD"] if environment_order is None else environment_order
 
 
 class ReleaseAnalyzer:
@@ -41,6 +62,28 @@ class ReleaseAnalyzer:
         self.logger = logging.getLogger(__name__)
         self.expand_merge_commits = expand_merge_commits
     
+    def _fetch_version_infos(self, project_config) -> List[Tuple[str, Optional[VersionInfo]]]:
+        """
+        Fetch version info for every environment of a project.
+        
+        The actuator requests are IO-bound, so they run concurrently. Results
+        keep the order of project_config.env.
+        """
+        def fetch(env_item):
+            env_name, env_url = env_item
+            self.logger.info(f"Fetching version info for {project_config.name} - {env_name}")
+            return env_name, self.api_client.get_version_info(
+                env_url, env_name, project_config.verify_ssl, project_config.use_version_fallback
+            )
+        
+        env_items = list(project_config.env.items())
+        if len(env_items) <= 1:
+            return [fetch(env_item) for env_item in env_items]
+        
+        max_workers = min(len(env_items), MAX_VERSION_FETCH_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fetch, env_items))
+    
     def analyze_project(self, project_config) -> Optional[ProjectAnalysis]:
         """
         Analyze a single project across all environments.
@@ -53,11 +96,7 @@ class ReleaseAnalyzer:
         """
         # Fetch version info from all environments
         version_infos = {}
-        for env_name, env_url in project_config.env.items():
-            self.logger.info(f"Fetching version info for {project_config.name} - {env_name}")
-            version_info = self.api_client.get_version_info(
-                env_url, env_name, project_config.verify_ssl, project_config.use_version_fallback
-            )
+        for env_name, version_info in self._fetch_version_infos(project_config):
             if version_info:
                 version_infos[env_name] = version_info
             else:
@@ -176,13 +215,7 @@ class ReleaseAnalyzer:
         Returns:
             Set of unique JIRA ticket IDs
         """
-        jira_pattern = re.compile(r'\b([A-Z]{1,10}-\d+)\b')
-        tickets = set()
-        
-        for commit in commits:
-            message = commit.get('message', '')
-            if message:
-                matches = jira_pattern.findall(message)
-                tickets.update(matches)
-        
-        return tickets
\ No newline at end of file
+        # Scan all messages in one pass; the newline separator keeps \b boundaries
+        # between messages intact
+        messages = '\n'.join(commit.get('message') or '' for commit in commits)
+        return set(JIRA_TICKET_PATTERN.findall(messages))
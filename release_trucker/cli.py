@@ -1,6 +1,7 @@
 import click
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
@@ -10,6 +11,9 @@ from .report_generator import HTMLReportGenerator
 from .csv_report_generator import CSVReportGenerator
 from .release_manager import ReleaseManager
 
+# Upper bound on projects analyzed at the same time
+MAX_PROJECT_WORKERS = 8
+
 
 def setup_logging(verbose: bool = False):
     """Setup logging configuration."""
@@ -21,6 +25,29 @@ def setup_logging(verbose: bool = False):
     )
 
 
+def analyze_projects(analyzer: ReleaseAnalyzer, projects) -> List[ProjectAnalysis]:
+    """Analyze projects concurrently, returning successful analyses in config order."""
+    logger = logging.getLogger(__name__)
+    
+    def analyze_one(project):
+        logger.info(f"Analyzing project: {project.name}")
+        analysis = analyzer.analyze_project(project)
+        if analysis:
+            logger.info(f"Successfully analyzed {project.name}")
+        else:
+            logger.warning(f"Failed to analyze {project.name}")
+        return analysis
+    
+    if len(projects) <= 1:
+        results = [analyze_one(project) for project in projects]
+    else:
+        # Each project is dominated by network and git IO, so threads overlap well
+        with ThreadPoolExecutor(max_workers=min(len(projects), MAX_PROJECT_WORKERS)) as executor:
+            results = list(executor.map(analyze_one, projects))
+    
+    return [analysis for analysis in results if analysis]
+
+
 @click.group()
 @click.option('--verbose', '-v',
               is_flag=True,
@@ -39,7 +66,7 @@ def cli(ctx, verbose: bool):
               help='Configuration file path')
 @click.option('--output', '-o',
               default='release_report.html',
-              help='Output HTML file path')
+              help='Output HTML file path (use a .gz suffix to compress)')
 @click.option('--csv-output',
               help='Output CSV file path (optional)')
 @click.option('--csv-format',
@@ -76,15 +103,7 @@ def analyze(ctx, config: str, output: str, csv_output: str, csv_format: str, csv
         analyzer = ReleaseAnalyzer()
         
         # Analyze all projects
-        analyses: List[ProjectAnalysis] = []
-        for project in cfg.projects:
-            logger.info(f"Analyzing project: {project.name}")
-            analysis = analyzer.analyze_project(project)
-            if analysis:
-                analyses.append(analysis)
-                logger.info(f"Successfully analyzed {project.name}")
-            else:
-                logger.warning(f"Failed to analyze {project.name}")
+        analyses = analyze_projects(analyzer, cfg.projects)
         
         if not analyses:
             raise click.ClickException("No projects could be analyzed successfully")
@@ -153,6 +172,7 @@ def release(ctx, config: str, jira_ticket: str):
     the release branch name and tag annotation.
     """
     logger = logging.getLogger(__name__)
+    release_manager = None
     
     try:
         # Validate JIRA ticket format
@@ -240,6 +260,9 @@ def release(ctx, config: str, jira_ticket: str):
     except Exception as e:
         logger.error(f"Release process error: {e}")
         raise click.ClickException(str(e))
+    finally:
+        if release_manager is not None:
+            release_manager.close()
 
 
 if __name__ == '__main__':
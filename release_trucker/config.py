@@ -2,6 +2,12 @@ import yaml
 from dataclasses import dataclass
 from typing import Dict, List
 
+try:
+    # libyaml's C parser is much faster; fall back when PyYAML was built without it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 @dataclass
 class ProjectConfig:
@@ -22,7 +28,7 @@ class Config:
 def load_config(config_path: str = "config.yaml") -> Config:
     """Load configuration from YAML file."""
     with open(config_path, 'r') as file:
-        data = yaml.safe_load(file)
+        data = yaml.load(file, Loader=SafeLoader)
     
     projects = []
     if data and 'projects' in data:
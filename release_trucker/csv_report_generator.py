@@ -2,11 +2,38 @@ import csv
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Set, Any
+from typing import List, Dict, Set, Any, Iterator, Tuple
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import Counter
 
-from .analyzer import ProjectAnalysis
+from .analyzer import ProjectAnalysis, EnvironmentCommits, JIRA_TICKET_PATTERN
+
+
+# Buffer size for CSV output; rows are small, so a large buffer turns many
+# tiny writes into a few large ones
+CSV_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Environment columns of the summary report, in output order
+SUMMARY_ENVIRONMENTS = ("DEV", "TEST", "PRE", "PROD")
+
+# CSV column headers, built once
+SUMMARY_FIELDNAMES = (
+    'JIRA_Ticket', 'Project', *SUMMARY_ENVIRONMENTS,
+    'Total_Environments', 'First_Seen_Version', 'Latest_Version',
+    'First_Commit_Date', 'Latest_Commit_Date'
+)
+DETAILED_FIELDNAMES = (
+    'JIRA_Ticket', 'Project', 'Environment', 'Version',
+    'Commit_ID', 'Commit_Date', 'Commit_Message'
+)
+
+# Bit assigned to each summary environment, and the Yes/No column values for
+# every combination of those bits
+_ENVIRONMENT_BITS = {env: 1 << i for i, env in enumerate(SUMMARY_ENVIRONMENTS)}
+_ENVIRONMENT_COLUMNS = tuple(
+    tuple('Yes' if mask & bit else 'No' for bit in _ENVIRONMENT_BITS.values())
+    for mask in range(1 << len(SUMMARY_ENVIRONMENTS))
+)
 
 
 @dataclass
@@ -22,9 +49,13 @@ class JiraTicketSummary:
     latest_commit_date: str = ""
 
 
-@dataclass
+@dataclass(frozen=True)
 class JiraTicketDetail:
     """Detailed information for a JIRA ticket in a specific environment."""
+    # One instance is created per ticket per commit, so skip the per-instance __dict__
+    __slots__ = ('ticket_id', 'project', 'environment', 'version',
+                 'commit_id', 'commit_date', 'commit_message')
+    
     ticket_id: str
     project: str
     environment: str
@@ -51,168 +82,192 @@ class CSVReportGenerator:
         """
         self.logger.info(f"Generating {format_type} CSV report: {output_file}")
         
-        if format_type == "summary":
+        if format_type not in ("summary", "detailed"):
+            raise ValueError(f"Unsupported CSV format: {format_type}")
+        
+        if not analyses:
+            self._generate_empty_report(output_file, format_type)
+        elif format_type == "summary":
             self._generate_summary_report(analyses, output_file)
-        elif format_type == "detailed":
-            self._generate_detailed_report(analyses, output_file)
         else:
-            raise ValueError(f"Unsupported CSV format: {format_type}")
+            self._generate_detailed_report(analyses, output_file)
         
         self.logger.info(f"CSV report generated successfully: {output_file}")
     
+    def _generate_empty_report(self, output_file: str, format_type: str):
+        """Write a header-only CSV report without walking any analyses."""
+        fieldnames = SUMMARY_FIELDNAMES if format_type == "summary" else DETAILED_FIELDNAMES
+        
+        # Header names need no quoting, so skip csv.writer for this single row
+        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
+            csvfile.write(','.join(fieldnames) + '\r\n')
+        
+        self.logger.info("No analyses to report, CSV report written with headers only")
+    
     def _generate_summary_report(self, analyses: List[ProjectAnalysis], output_file: str):
         """Generate summary CSV report showing tickets across environments."""
         # Collect all JIRA tickets and their environment information
         ticket_summaries = self._collect_ticket_summaries(analyses)
         
-        # Define environment order for consistent columns
-        env_order = ["DEV", "TEST", "PRE", "PROD"]
-        
         # Write CSV file
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['JIRA_Ticket', 'Project'] + env_order + [
-                'Total_Environments', 'First_Seen_Version', 'Latest_Version', 
-                'First_Commit_Date', 'Latest_Commit_Date'
-            ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
+        with open(output_file, 'w', newline='', encoding='utf-8',
+                  buffering=CSV_WRITE_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(SUMMARY_FIELDNAMES)
             
-            # Sort tickets alphabetically for consistent output
-            for summary in sorted(ticket_summaries, key=lambda x: (x.project, x.ticket_id)):
-                row = {
-                    'JIRA_Ticket': summary.ticket_id,
-                    'Project': summary.project,
-                    'Total_Environments': summary.total_environments,
-                    'First_Seen_Version': summary.first_seen_version,
-                    'Latest_Version': summary.latest_version,
-                    'First_Commit_Date': summary.first_commit_date,
-                    'Latest_Commit_Date': summary.latest_commit_date
-                }
-                
-                # Add Yes/No for each environment
-                for env in env_order:
-                    row[env] = 'Yes' if env in summary.environments else 'No'
-                
-                writer.writerow(row)
+            # Summaries arrive sorted; rows are emitted as tuples in column order
+            # and written in a single writerows() call
+            writer.writerows(
+                (
+                    summary.ticket_id,
+                    summary.project,
+                    # Yes/No for each environment
+                    *_ENVIRONMENT_COLUMNS[self._environment_mask(summary.environments)],
+                    summary.total_environments,
+                    summary.first_seen_version,
+                    summary.latest_version,
+                    summary.first_commit_date,
+                    summary.latest_commit_date
+                )
+                for summary in ticket_summaries
+            )
         
         self.logger.info(f"Summary CSV report written with {len(ticket_summaries)} JIRA tickets")
     
+    def _environment_mask(self, environments: Set[str]) -> int:
+        """Encode the summary environments a ticket appears in as a bitmask."""
+        mask = 0
+        for env in environments:
+            mask |= _ENVIRONMENT_BITS.get(env, 0)
+        return mask
+    
     def _generate_detailed_report(self, analyses: List[ProjectAnalysis], output_file: str):
         """Generate detailed CSV report showing each ticket occurrence."""
         # Collect all JIRA ticket details
         ticket_details = self._collect_ticket_details(analyses)
         
         # Write CSV file
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = [
-                'JIRA_Ticket', 'Project', 'Environment', 'Version', 
-                'Commit_ID', 'Commit_Date', 'Commit_Message'
-            ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
+        with open(output_file, 'w', newline='', encoding='utf-8',
+                  buffering=CSV_WRITE_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(DETAILED_FIELDNAMES)
             
-            # Sort by project, ticket, environment for consistent output
-            for detail in sorted(ticket_details, key=lambda x: (x.project, x.ticket_id, x.environment)):
-                writer.writerow({
-                    'JIRA_Ticket': detail.ticket_id,
-                    'Project': detail.project,
-                    'Environment': detail.environment,
-                    'Version': detail.version,
-                    'Commit_ID': detail.commit_id[:8] if detail.commit_id else '',  # Short commit ID
-                    'Commit_Date': detail.commit_date,
-                    'Commit_Message': self._clean_commit_message(detail.commit_message)
-                })
+            # Details arrive sorted by project, ticket, environment
+            writer.writerows(
+                (
+                    detail.ticket_id,
+                    detail.project,
+                    detail.environment,
+                    detail.version,
+                    detail.commit_id[:8] if detail.commit_id else '',  # Short commit ID
+                    detail.commit_date,
+                    self._clean_commit_message(detail.commit_message)
+                )
+                for detail in ticket_details
+            )
         
         self.logger.info(f"Detailed CSV report written with {len(ticket_details)} ticket entries")
     
+    def _iter_ticket_commits(self, analyses: List[ProjectAnalysis]) -> Iterator[Tuple[str, str, EnvironmentCommits, dict, Set[str]]]:
+        """
+        Walk all commits once, yielding each commit that references JIRA tickets.
+        
+        Args:
+            analyses: List of ProjectAnalysis objects
+        
+        Yields:
+            Tuples of (project_name, env_name, env_commits, commit, ticket_ids)
+        """
+        for analysis in analyses:
+            project_name = analysis.project_name
+            
+            for env_name, env_commits in analysis.environments.items():
+                for commit in env_commits.commits:
+                    ticket_ids = self._extract_jira_tickets_from_message(commit.get('message', ''))
+                    if ticket_ids:
+                        yield project_name, env_name, env_commits, commit, ticket_ids
+    
     def _collect_ticket_summaries(self, analyses: List[ProjectAnalysis]) -> List[JiraTicketSummary]:
-        """Collect and aggregate JIRA ticket information for summary report."""
-        # Dictionary to track ticket information: (project, ticket_id) -> summary data
-        ticket_data: Dict[tuple, Dict[str, Any]] = defaultdict(lambda: {
-            'environments': set(),
-            'versions': [],
-            'commit_dates': []
-        })
+        """Collect and aggregate JIRA ticket information for summary report, sorted by project and ticket."""
+        # Summaries are accumulated in place: (project, ticket_id) -> JiraTicketSummary
+        summaries: Dict[Tuple[str, str], JiraTicketSummary] = {}
         
-        # Process each project analysis
+        # Register each JIRA ticket found in each environment
         for analysis in analyses:
             project_name = analysis.project_name
             
-            # Process each environment in the project
             for env_name, env_commits in analysis.environments.items():
-                # Add each JIRA ticket found in this environment
+                version = env_commits.version
                 for ticket_id in env_commits.jira_tickets:
-                    key = (project_name, ticket_id)
-                    ticket_data[key]['environments'].add(env_name)
-                    ticket_data[key]['versions'].append(env_commits.version)
-                    
-                    # Extract commit dates from commits containing this ticket
-                    for commit in env_commits.commits:
-                        if ticket_id in commit.get('message', ''):
-                            commit_date = commit.get('date', '')
-                            if commit_date:
-                                ticket_data[key]['commit_dates'].append(commit_date)
+                    summary = summaries.get((project_name, ticket_id))
+                    if summary is None:
+                        summary = JiraTicketSummary(
+                            ticket_id=ticket_id,
+                            project=project_name,
+                            environments=set(),
+                            total_environments=0,
+                            first_seen_version=version,
+                            latest_version=version
+                        )
+                        summaries[(project_name, ticket_id)] = summary
+                    else:
+                        # Versions are compared as strings (alphabetical first/latest)
+                        summary.first_seen_version = min(summary.first_seen_version, version)
+                        summary.latest_version = max(summary.latest_version, version)
+                    summary.environments.add(env_name)
+                    summary.total_environments = len(summary.environments)
         
-        # Convert to JiraTicketSummary objects
-        summaries = []
-        for (project_name, ticket_id), data in ticket_data.items():
-            # Sort versions and dates to get first and latest
-            versions = sorted(set(data['versions']))
-            dates = sorted(data['commit_dates'])
+        # Track first/latest commit dates (just date part) in the same commit walk
+        # used by the detailed report
+        for project_name, _, _, commit, ticket_ids in self._iter_ticket_commits(analyses):
+            commit_date = commit.get('date', '')
+            if not commit_date:
+                continue
             
-            summary = JiraTicketSummary(
-                ticket_id=ticket_id,
-                project=project_name,
-                environments=data['environments'],
-                total_environments=len(data['environments']),
-                first_seen_version=versions[0] if versions else '',
-                latest_version=versions[-1] if versions else '',
-                first_commit_date=dates[0][:10] if dates else '',  # Just date part
-                latest_commit_date=dates[-1][:10] if dates else ''  # Just date part
-            )
-            summaries.append(summary)
+            # Slice the date part once per commit, not once per ticket
+            commit_day = commit_date[:10]
+            for ticket_id in ticket_ids:
+                summary = summaries.get((project_name, ticket_id))
+                if summary is None:
+                    continue
+                if not summary.first_commit_date or commit_day < summary.first_commit_date:
+                    summary.first_commit_date = commit_day
+                if commit_day > summary.latest_commit_date:
+                    summary.latest_commit_date = commit_day
         
-        return summaries
+        # Sort tickets alphabetically for consistent output
+        return sorted(summaries.values(), key=lambda x: (x.project, x.ticket_id))
     
     def _collect_ticket_details(self, analyses: List[ProjectAnalysis]) -> List[JiraTicketDetail]:
-        """Collect detailed JIRA ticket information for detailed report."""
+        """Collect detailed JIRA ticket information for detailed report, sorted by project, ticket and environment."""
         details = []
         
-        # Process each project analysis
-        for analysis in analyses:
-            project_name = analysis.project_name
+        for project_name, env_name, env_commits, commit, ticket_ids in self._iter_ticket_commits(analyses):
+            commit_message = commit.get('message', '')
+            commit_date = commit.get('date', '')
+            commit_day = commit_date[:10] if commit_date else ''  # Just date part
+            commit_id = commit.get('id', '')
             
-            # Process each environment in the project
-            for env_name, env_commits in analysis.environments.items():
-                # Process each commit in this environment
-                for commit in env_commits.commits:
-                    commit_message = commit.get('message', '')
-                    commit_date = commit.get('date', '')
-                    commit_id = commit.get('id', '')
-                    
-                    # Extract JIRA tickets from this commit message
-                    tickets_in_commit = self._extract_jira_tickets_from_message(commit_message)
-                    
-                    # Create detail entry for each ticket in this commit
-                    for ticket_id in tickets_in_commit:
-                        detail = JiraTicketDetail(
-                            ticket_id=ticket_id,
-                            project=project_name,
-                            environment=env_name,
-                            version=env_commits.version,
-                            commit_id=commit_id,
-                            commit_date=commit_date[:10] if commit_date else '',  # Just date part
-                            commit_message=commit_message
-                        )
-                        details.append(detail)
+            # Create detail entry for each ticket in this commit
+            for ticket_id in ticket_ids:
+                detail = JiraTicketDetail(
+                    ticket_id=ticket_id,
+                    project=project_name,
+                    environment=env_name,
+                    version=env_commits.version,
+                    commit_id=commit_id,
+                    commit_date=commit_day,
+                    commit_message=commit_message
+                )
+                details.append(detail)
         
+        # Sort by project, ticket, environment for consistent output
+        details.sort(key=lambda x: (x.project, x.ticket_id, x.environment))
         return details
     
     def _extract_jira_tickets_from_message(self, message: str) -> Set[str]:
         """Extract JIRA ticket IDs from a commit message."""
-        import re
-        jira_pattern = re.compile(r'\b([A-Z]{1,10}-\d+)\b')
-        return set(jira_pattern.findall(message))
+        return set(JIRA_TICKET_PATTERN.findall(message))
     
     def _clean_commit_message(self, message: str) -> str:
         """Clean commit message for CSV output."""
@@ -237,17 +292,9 @@ class CSVReportGenerator:
         
         # Calculate statistics
         total_tickets = len(ticket_summaries)
-        tickets_by_env = defaultdict(int)
-        tickets_by_project = defaultdict(int)
-        multi_env_tickets = 0
-        
-        for summary in ticket_summaries:
-            tickets_by_project[summary.project] += 1
-            if summary.total_environments > 1:
-                multi_env_tickets += 1
-            
-            for env in summary.environments:
-                tickets_by_env[env] += 1
+        tickets_by_env = Counter(env for summary in ticket_summaries for env in summary.environments)
+        tickets_by_project = Counter(summary.project for summary in ticket_summaries)
+        multi_env_tickets = sum(1 for summary in ticket_summaries if summary.total_environments > 1)
         
         return {
             'total_tickets': total_tickets,
@@ -1,8 +1,9 @@
 import os
 import shutil
+import threading
 from pathlib import Path
 from git import Repo, GitCommandError
-from typing import List, Optional
+from typing import Dict, List, Optional
 import logging
 
 
@@ -13,6 +14,14 @@ class GitManager:
         self.repos_dir = Path(repos_dir)
         self.repos_dir.mkdir(exist_ok=True)
         self.logger = logging.getLogger(__name__)
+        # Projects may be analyzed concurrently; serialize git work per checkout
+        self._repo_locks: Dict[Path, threading.Lock] = {}
+        self._repo_locks_guard = threading.Lock()
+    
+    def _repo_lock(self, repo_path: Path) -> threading.Lock:
+        """Return the lock guarding clone/fetch of a single checkout."""
+        with self._repo_locks_guard:
+            return self._repo_locks.setdefault(repo_path, threading.Lock())
     
     def get_or_update_repo(self, repo_url: str, project_name: str) -> Optional[Repo]:
         """
@@ -27,35 +36,37 @@ class GitManager:
         """
         repo_path = self.repos_dir / project_name
         
-        try:
-            if repo_path.exists():
-                self.logger.info(f"Updating existing repository: {project_name}")
-                repo = Repo(repo_path)
-                origin = repo.remotes.origin
-                origin.fetch()
-                # Reset to latest origin/main or origin/master
-                try:
-                    repo.heads.main.checkout()
-                    repo.heads.main.reset('origin/main', index=True, working_tree=True)
-                except:
+        # Two projects sharing a checkout must not clone or fetch into it at once
+        with self._repo_lock(repo_path):
+            try:
+                if repo_path.exists():
+                    self.logger.info(f"Updating existing repository: {project_name}")
+                    repo = Repo(repo_path)
+                    origin = repo.remotes.origin
+                    origin.fetch()
+                    # Reset to latest origin/main or origin/master
                     try:
-                        repo.heads.master.checkout()
-                        repo.heads.master.reset('origin/master', index=True, working_tree=True)
+                        repo.heads.main.checkout()
+                        repo.heads.main.reset('origin/main', index=True, working_tree=True)
                     except:
-                        self.logger.warning(f"Could not reset to main/master for {project_name}")
+                        try:
+                            repo.heads.master.checkout()
+                            repo.heads.master.reset('origin/master', index=True, working_tree=True)
+                        except:
+                            self.logger.warning(f"Could not reset to main/master for {project_name}")
                 
-                return repo
-            else:
-                self.logger.info(f"Cloning repository: {project_name}")
-                repo = Repo.clone_from(repo_url, repo_path)
-                return repo
+                    return repo
+                else:
+                    self.logger.info(f"Cloning repository: {project_name}")
+                    repo = Repo.clone_from(repo_url, repo_path)
+                    return repo
                 
-        except GitCommandError as e:
-            self.logger.error(f"Git operation failed for {project_name}: {e}")
-            return None
-        except Exception as e:
-            self.logger.error(f"Unexpected error managing repository {project_name}: {e}")
-            return None
+            except GitCommandError as e:
+                self.logger.error(f"Git operation failed for {project_name}: {e}")
+                return None
+            except Exception as e:
+                self.logger.error(f"Unexpected error managing repository {project_name}: {e}")
+                return None
     
     def get_commits_between(self, repo: Repo, from_commit: str, to_commit: str, expand_merges: bool = True) -> List[dict]:
         """
@@ -73,18 +84,7 @@ class GitManager:
         try:
             # Get commits that are in to_commit but not in from_commit
             commit_range = f"{from_commit}..{to_commit}"
-            commits = list(repo.iter_commits(commit_range))
-            
-            commit_info = []
-            for commit in commits:
-                commit_info.append({
-                    'id': commit.hexsha,
-                    'short_id': commit.hexsha[:8],
-                    'message': commit.message.strip(),
-                    'author': str(commit.author),
-                    'date': commit.committed_datetime.isoformat(),
-                    'summary': commit.summary
-                })
+            commit_info = [self._commit_to_dict(commit) for commit in repo.iter_commits(commit_range)]
             
             if expand_merges:
                 commit_info = self._expand_merge_commits(repo, commit_info, from_commit)
@@ -98,6 +98,19 @@ class GitManager:
             self.logger.error(f"Unexpected error getting commits: {e}")
             return []
     
+    def _commit_to_dict(self, commit) -> dict:
+        """Convert a git commit into the commit information dictionary used by reports."""
+        # hexsha is resolved lazily by GitPython, so read it only once
+        hexsha = commit.hexsha
+        return {
+            'id': hexsha,
+            'short_id': hexsha[:8],
+            'message': commit.message.strip(),
+            'author': str(commit.author),
+            'date': commit.committed_datetime.isoformat(),
+            'summary': commit.summary
+        }
+    
     def commit_exists(self, repo: Repo, commit_id: str) -> bool:
         """Check if a commit exists in the repository."""
         try:
@@ -178,17 +191,10 @@ class GitManager:
                             # Add commits that haven't been seen yet
                             for parent_commit in reversed(parent_commits):  # Reverse to maintain chronological order
                                 if parent_commit.hexsha not in seen_commits:
-                                    parent_commit_info = {
-                                        'id': parent_commit.hexsha,
-                                        'short_id': parent_commit.hexsha[:8],
-                                        'message': parent_commit.message.strip(),
-                                        'author': str(parent_commit.author),
-                                        'date': parent_commit.committed_datetime.isoformat(),
-                                        'summary': parent_commit.summary,
-                                        'is_merged_commit': True  # Mark as merged commit for identification
-                                    }
+                                    parent_commit_info = self._commit_to_dict(parent_commit)
+                                    parent_commit_info['is_merged_commit'] = True  # Mark as merged commit for identification
                                     expanded_commits.append(parent_commit_info)
-                                    seen_commits.add(parent_commit.hexsha)
+                                    seen_commits.add(parent_commit_info['id'])
                                     
                         except GitCommandError as e:
                             self.logger.debug(f"Could not expand merge parent {parent.hexsha[:8]}: {e}")
@@ -208,7 +214,13 @@ class GitManager:
         return expanded_commits
 
     def cleanup_repos(self):
-        """Remove all cloned repositories."""
-        if self.repos_dir.exists():
-            shutil.rmtree(self.repos_dir)
-            self.repos_dir.mkdir(exist_ok=True)
\ No newline at end of file
+        """Remove all cloned repositories, keeping the repos directory itself."""
+        if not self.repos_dir.exists():
+            self.repos_dir.mkdir(exist_ok=True)
+            return
+        
+        for entry in self.repos_dir.iterdir():
+            if entry.is_dir() and not entry.is_symlink():
+                shutil.rmtree(entry)
+            else:
+                entry.unlink()
\ No newline at end of file
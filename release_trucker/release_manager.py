@@ -1,16 +1,23 @@
 import logging
 import re
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Set
 from pathlib import Path
 from git import Repo, GitCommandError
 
 from .config import ProjectConfig
 from .git_manager import GitManager
 
+VALID_JIRA_TICKET_PATTERN = re.compile(r'^[A-Z]{1,10}-\d+$')
+VERSION_PATTERN = re.compile(r'^(\d+)\.(\d+)\.(\d+)$')
 
-@dataclass
+
+@dataclass(frozen=True)
 class VersionInfo:
+    # Built once per tag when scanning a repository, so skip the per-instance __dict__
+    __slots__ = ('major', 'minor', 'patch')
+    
     major: int
     minor: int
     patch: int
@@ -32,6 +39,26 @@ class VersionInfo:
         return VersionInfo(self.major, self.minor, self.patch + 1)
 
 
+@lru_cache(maxsize=4096)
+def _parse_version(version_str: str) -> Optional[VersionInfo]:
+    # VersionInfo is frozen, so one instance per tag name can be shared across calls
+    match = VERSION_PATTERN.match(version_str)
+    if match:
+        return VersionInfo(
+            major=int(match.group(1)),
+            minor=int(match.group(2)),
+            patch=int(match.group(3))
+        )
+    return None
+
+
+@dataclass(frozen=True)
+class TagScan:
+    """Everything prepare_release needs from a repository's tags, read in one pass."""
+    latest: Optional[VersionInfo]
+    highest_major: int
+
+
 @dataclass
 class ReleaseInfo:
     project_name: str
@@ -49,135 +76,126 @@ class ReleaseManager:
     def __init__(self):
         self.git_manager = GitManager()
         self.logger = logging.getLogger(__name__)
+        # Opened repositories per path; gitpython updates them in place on writes
+        self._repo_cache: Dict[Path, Repo] = {}
+    
+    def _repo(self, repo_path: Path) -> Repo:
+        """Return the Repo for a path, opening it only on first use."""
+        key = Path(repo_path)
+        repo = self._repo_cache.get(key)
+        if repo is None:
+            repo = Repo(key)
+            self._repo_cache[key] = repo
+        return repo
+    
+    def close(self):
+        """Close the opened repositories, stopping their persistent git processes."""
+        for repo in self._repo_cache.values():
+            repo.close()
+        self._repo_cache.clear()
     
     def validate_jira_ticket(self, ticket: str) -> bool:
         """Validate JIRA ticket format (e.g., BWD-123)."""
-        pattern = r'^[A-Z]{1,10}-\d+$'
-        return bool(re.match(pattern, ticket))
+        return bool(VALID_JIRA_TICKET_PATTERN.match(ticket))
     
     def get_all_tags(self, repo_path: Path) -> List[str]:
         """Get all tags from repository."""
         try:
-            repo = Repo(repo_path)
-            tags = [tag.name for tag in repo.tags]
-            return tags
+            repo = self._repo(repo_path)
+            return [tag.name for tag in repo.tags]
         except (GitCommandError, Exception) as e:
             self.logger.debug(f"Failed to get tags from {repo_path}: {e}")
             return []
     
     def parse_version(self, version_str: str) -> Optional[VersionInfo]:
         """Parse version string into VersionInfo."""
-        pattern = r'^(\d+)\.(\d+)\.(\d+)$'
-        match = re.match(pattern, version_str)
-        if match:
-            return VersionInfo(
-                major=int(match.group(1)),
-                minor=int(match.group(2)),
-                patch=int(match.group(3))
-            )
-        return None
+        return _parse_version(version_str)
     
-    def get_latest_version(self, repo_path: Path) -> Optional[VersionInfo]:
-        """Get the latest version from repository tags that match semantic versioning pattern."""
+    def get_sorted_version_tags(self, repo_path: Path) -> List[str]:
+        """Get tag names sorted by version, newest first, with git doing the sort."""
         try:
-            repo = Repo(repo_path)
-            versions = []
-            
-            # Filter tags to only include those matching semantic versioning pattern
-            for tag in repo.tags:
-                version = self.parse_version(tag.name)
-                if version:  # Only include tags that match major.minor.patch pattern
-                    versions.append(version)
-            
-            if not versions:
-                return None
-            
-            # Sort by major, minor, patch and return the latest
-            versions.sort(key=lambda v: (v.major, v.minor, v.patch), reverse=True)
-            return versions[0]
-            
+            repo = self._repo(repo_path)
+            output = repo.git.for_each_ref('--sort=-v:refname', '--format=%(refname:lstrip=2)', 'refs/tags/')
+            return output.splitlines()
         except (GitCommandError, Exception) as e:
-            self.logger.debug(f"Failed to get latest version from {repo_path}: {e}")
-            return None
+            self.logger.debug(f"Failed to get sorted tags from {repo_path}: {e}")
+            return []
+    
+    def _tag_index(self, repo_path: Path) -> Dict[str, VersionInfo]:
+        """Map each version tag name to its version, newest first."""
+        # Only tags matching the major.minor.patch pattern count as versions
+        index = {}
+        for name in self.get_sorted_version_tags(repo_path):
+            version = self.parse_version(name)
+            if version:
+                index[name] = version
+        return index
     
-    def get_highest_major_version(self, repo_path: Path) -> int:
+    def _scan_tags(self, repo_path: Path, tag_index: Optional[Dict[str, VersionInfo]] = None) -> TagScan:
+        """Collect the latest version and the highest major in a single pass."""
+        if tag_index is None:
+            tag_index = self._tag_index(repo_path)
+        
+        # The index is ordered newest first, so its first entry is the latest version
+        latest = next(iter(tag_index.values()), None)
+        return TagScan(latest=latest, highest_major=latest.major if latest else 0)
+    
+    def get_latest_version(self, repo_path: Path) -> Optional[VersionInfo]:
+        """Get the latest version from repository tags that match semantic versioning pattern."""
+        return self._scan_tags(repo_path).latest
+    
+    def get_highest_major_version(self, repo_path: Path,
+                                  tag_index: Optional[Dict[str, VersionInfo]] = None) -> int:
         """Get the highest major version from repository tags that match semantic versioning pattern."""
-        try:
-            repo = Repo(repo_path)
-            major_versions = []
-            
-            # Filter tags to only include those matching semantic versioning pattern
-            for tag in repo.tags:
-                version = self.parse_version(tag.name)
-                if version:  # Only include tags that match major.minor.patch pattern
-                    major_versions.append(version.major)
-            
-            return max(major_versions) if major_versions else 0
-            
-        except (GitCommandError, Exception) as e:
-            self.logger.debug(f"Failed to get highest major version from {repo_path}: {e}")
-            return 0
+        return self._scan_tags(repo_path, tag_index).highest_major
+    
+    @staticmethod
+    def _local_branch_names(repo: Repo) -> Set[str]:
+        """Names of the local branches, for membership checks."""
+        return {head.name for head in repo.heads}
     
     def branch_exists(self, repo_path: Path, branch_name: str) -> bool:
         """Check if branch exists locally or remotely."""
         try:
-            repo = Repo(repo_path)
-            
-            # Check local branches
-            for head in repo.heads:
-                if head.name == branch_name:
-                    return True
+            repo = self._repo(repo_path)
             
-            # Check remote branches
-            try:
-                for remote_ref in repo.remotes.origin.refs:
-                    if remote_ref.name == f'origin/{branch_name}':
-                        return True
-            except (AttributeError, GitCommandError):
-                # No origin remote or error accessing remote refs
-                pass
-            
-            return False
+            # Probe the local and origin refs with a single git call
+            candidates = {f'refs/heads/{branch_name}', f'refs/remotes/origin/{branch_name}'}
+            matches = repo.git.for_each_ref('--format=%(refname)', *sorted(candidates))
+            # Patterns also match refs nested below the name, so compare exactly
+            return not candidates.isdisjoint(matches.split())
             
         except (GitCommandError, Exception) as e:
             self.logger.debug(f"Failed to check branch existence for {branch_name}: {e}")
             return False
     
-    def get_commits_since_last_tag(self, repo_path: Path, reference: str = "HEAD") -> int:
-        """Get number of commits since last semantic versioning tag.
+    def get_commits_since_last_tag(self, repo_path: Path, reference: str = "HEAD",
+                                   tag_index: Optional[Dict[str, VersionInfo]] = None) -> int:
+        """Get number of commits since the highest semantic versioning tag.
         
         Args:
             repo_path: Path to the repository
             reference: Git reference to count commits from (default: HEAD)
                       Use 'origin/main' or 'origin/master' to count from remote branch
+            tag_index: Version tags already read for this repository, if any
         """
         try:
-            repo = Repo(repo_path)
+            repo = self._repo(repo_path)
             
-            # Get the latest semantic versioning tag by commit date
-            latest_semantic_tag = None
-            latest_tag_commit = None
+            if tag_index is None:
+                tag_index = self._tag_index(repo_path)
+            # The index is ordered newest first
+            latest_tag = next(iter(tag_index), None)
             
-            if repo.tags:
-                # Filter to only semantic versioning tags and sort by commit date
-                semantic_tags = []
-                for tag in repo.tags:
-                    if self.parse_version(tag.name):  # Only include tags that match major.minor.patch pattern
-                        semantic_tags.append(tag)
-                
-                if semantic_tags:
-                    sorted_tags = sorted(semantic_tags, key=lambda t: t.commit.committed_date, reverse=True)
-                    latest_semantic_tag = sorted_tags[0]
-                    latest_tag_commit = latest_semantic_tag.commit
-            
-            if latest_tag_commit:
+            if latest_tag:
                 # Count commits since that semantic versioning tag
-                commits = list(repo.iter_commits(f'{latest_tag_commit.hexsha}..{reference}'))
-                return len(commits)
+                rev = f'refs/tags/{latest_tag}..{reference}'
             else:
                 # No semantic versioning tags exist, count all commits
-                commits = list(repo.iter_commits(reference))
-                return len(commits)
+                rev = reference
+            
+            # Let git count instead of streaming every commit back through Python
+            return int(repo.git.rev_list('--count', rev))
                 
         except (GitCommandError, Exception) as e:
             self.logger.debug(f"Failed to count commits since last tag: {e}")
@@ -186,7 +204,7 @@ class ReleaseManager:
     def checkout_branch(self, repo_path: Path, branch_name: str, create: bool = False) -> bool:
         """Checkout to branch, optionally creating it."""
         try:
-            repo = Repo(repo_path)
+            repo = self._repo(repo_path)
             
             if create:
                 # Create new branch from current HEAD
@@ -195,7 +213,7 @@ class ReleaseManager:
             else:
                 # Checkout existing branch
                 # First check if it's a local branch
-                if branch_name in [head.name for head in repo.heads]:
+                if branch_name in self._local_branch_names(repo):
                     repo.heads[branch_name].checkout()
                 else:
                     # Try to checkout from remote
@@ -216,7 +234,7 @@ class ReleaseManager:
     def create_annotated_tag(self, repo_path: Path, tag_name: str, message: str) -> bool:
         """Create an annotated tag."""
         try:
-            repo = Repo(repo_path)
+            repo = self._repo(repo_path)
             # Create annotated tag at current HEAD
             repo.create_tag(tag_name, message=message)
             return True
@@ -244,6 +262,9 @@ class ReleaseManager:
             self.logger.error(f"Failed to checkout main branch {project.main_branch}")
             return None
         
+        # Tags don't depend on the checked-out branch, so read them once for every step below
+        tag_index = self._tag_index(repo_path)
+        
         # Check if release branch already exists
         if self.branch_exists(repo_path, release_branch):
             self.logger.info(f"Release branch {release_branch} already exists, checking out...")
@@ -251,11 +272,11 @@ class ReleaseManager:
                 return None
             
             # Bump minor version
-            latest_version = self.get_latest_version(repo_path)
-            if latest_version:
-                new_version = latest_version.bump_minor()
+            tag_scan = self._scan_tags(repo_path, tag_index)
+            if tag_scan.latest:
+                new_version = tag_scan.latest.bump_minor()
             else:
-                highest_major = self.get_highest_major_version(repo_path)
+                highest_major = tag_scan.highest_major
                 new_version = VersionInfo(highest_major + 1 if highest_major > 0 else 1, 0, 0)
         else:
             # Create new release branch from main
@@ -264,12 +285,12 @@ class ReleaseManager:
                 return None
             
             # Set major version as highest + 1, minor and patch as 0
-            highest_major = self.get_highest_major_version(repo_path)
+            highest_major = self.get_highest_major_version(repo_path, tag_index)
             new_version = VersionInfo(highest_major + 1 if highest_major > 0 else 1, 0, 0)
         
         # Check if there are changes since last tag (use remote main branch for accurate detection)
         remote_main_ref = f"origin/{project.main_branch}"
-        commits_count = self.get_commits_since_last_tag(repo_path, remote_main_ref)
+        commits_count = self.get_commits_since_last_tag(repo_path, remote_main_ref, tag_index)
         changes_since_last_tag = commits_count > 0
         
         if not changes_since_last_tag:
@@ -289,7 +310,7 @@ class ReleaseManager:
     def push_branch(self, repo_path: Path, branch_name: str) -> bool:
         """Push branch to remote repository."""
         try:
-            repo = Repo(repo_path)
+            repo = self._repo(repo_path)
             origin = repo.remotes.origin
             
             # Push branch and set upstream tracking
@@ -308,7 +329,7 @@ class ReleaseManager:
     def push_tag(self, repo_path: Path, tag_name: str) -> bool:
         """Push tag to remote repository."""
         try:
-            repo = Repo(repo_path)
+            repo = self._repo(repo_path)
             origin = repo.remotes.origin
             
             # Push the specific tag using refspec
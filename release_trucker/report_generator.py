@@ -1,7 +1,11 @@
+import gzip
+import io
+import os
+import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import List
-from jinja2 import Template
+from typing import BinaryIO, Dict, List, Optional, TextIO, Union
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache, Template, select_autoescape
 import logging
 
 from .analyzer import ProjectAnalysis
@@ -10,20 +14,65 @@ from .analyzer import ProjectAnalysis
 class HTMLReportGenerator:
     """Generates HTML reports for release analysis."""
     
-    def __init__(self):
+    def __init__(self, bytecode_cache_dir: Optional[str] = None):
         self.logger = logging.getLogger(__name__)
+        # Directory for compiled template bytecode; None uses Jinja's per-user temp directory
+        self.bytecode_cache_dir = bytecode_cache_dir
     
-    def generate_report(self, analyses: List[ProjectAnalysis], output_file: str = "release_report.html", project_configs: List = None):
+    def generate_report(self, analyses: List[ProjectAnalysis], output_file: Union[str, Path, TextIO] = "release_report.html", project_configs: List = None):
         """
         Generate HTML report from project analyses.
         
         Args:
             analyses: List of ProjectAnalysis objects
-            output_file: Output file path
+            output_file: Output file path (gzip-compressed when it ends in .gz), or a writable text stream
             project_configs: List of ProjectConfig objects for JIRA base URLs
         """
         template = self._get_template()
+        report_data = self._report_data(analyses, project_configs)
         
+        # Stream the rendered template instead of building the whole page in memory
+        if hasattr(output_file, 'write'):
+            template.stream(**report_data).dump(output_file)
+            self.logger.info("Report generated")
+            return
+        
+        # Resolve symlinks so the link keeps pointing at the report instead of being replaced
+        output_path = Path(os.path.realpath(output_file))
+        # Render beside the target and move it into place, so a failed render keeps the previous report
+        tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+        try:
+            with tmp_path.open('wb') as raw, self._open_output(raw, output_path.name) as f:
+                template.stream(**report_data).dump(f)
+            try:
+                # An existing report keeps its permissions
+                shutil.copymode(output_path, tmp_path)
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, output_path)
+        except Exception:
+            try:
+                tmp_path.unlink()
+            except FileNotFoundError:
+                pass
+            raise
+        
+        self.logger.info(f"Report generated: {output_path}")
+    
+    def _open_output(self, raw: BinaryIO, name: str) -> TextIO:
+        """Wrap an open report file for text writing, gzip-compressed when name ends in .gz."""
+        if name.endswith('.gz'):
+            # Reports are mostly repeated markup, so gzip shrinks them several times over.
+            # The header records the report's own name rather than the temp file's.
+            raw = gzip.GzipFile(filename=name, mode='wb', fileobj=raw, compresslevel=6)
+        return io.TextIOWrapper(raw, encoding='utf-8')
+    
+    def render_report(self, analyses: List[ProjectAnalysis], project_configs: List = None) -> str:
+        """Render the HTML report for project analyses and return it as a string."""
+        return self._get_template().render(**self._report_data(analyses, project_configs))
+    
+    def _report_data(self, analyses: List[ProjectAnalysis], project_configs: List = None) -> dict:
+        """Build the template context for a report."""
         # Create a mapping of project names to their configs for JIRA URLs
         project_config_map = {}
         if project_configs:
@@ -40,22 +89,13 @@ class HTMLReportGenerator:
                 projects_up_to_date.append(project)
         
         # Prepare data for template
-        report_data = {
+        return {
             'generated_at': datetime.now().isoformat(),
             'projects_with_changes': projects_with_changes,
             'projects_up_to_date': projects_up_to_date,
             'environment_order': ['DEV', 'TEST', 'PRE', 'PROD'],
             'project_configs': project_config_map
         }
-        
-        # Render template
-        html_content = template.render(**report_data)
-        
-        # Write to file
-        output_path = Path(output_file)
-        output_path.write_text(html_content, encoding='utf-8')
-        
-        self.logger.info(f"Report generated: {output_path.absolute()}")
     
     def _project_has_changes(self, project: ProjectAnalysis) -> bool:
         """
@@ -83,8 +123,13 @@ class HTMLReportGenerator:
         return False
     
     def _get_template(self) -> Template:
-        """Get Jinja2 template for HTML report."""
-        template_str = '''
+        """Get Jinja2 template for HTML report, compiled once and bytecode-cached on disk."""
+        return _report_environment(self.bytecode_cache_dir).get_template(REPORT_TEMPLATE_NAME)
+
+
+REPORT_TEMPLATE_NAME = 'report.html'
+
+REPORT_TEMPLATE = '''
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -447,10 +492,13 @@ class HTMLReportGenerator:
                 📦 {{ project.project_name }}
             </div>
             
+            {% set jira_base_url = project_configs[project.project_name].jira_base_url if project.project_name in project_configs else None %}
             <div class="environments">
                 {% for env in environment_order %}
                     {% if env in project.environments %}
                         {% set env_data = project.environments[env] %}
+                        {# Idle environments skip the JIRA lookups and render only their header #}
+                        {% set show_jira = env_data.jira_tickets and jira_base_url %}
                         <div class="environment">
                             <div class="env-header env-{{ env.lower() }}">
                                 <div class="env-info">
@@ -461,7 +509,7 @@ class HTMLReportGenerator:
                                     {% elif env != 'PROD' %}
                                         <span class="no-commits-inline">No new commits compared to baseline</span>
                                     {% endif %}
-                                    {% if env_data.jira_tickets and project.project_name in project_configs and project_configs[project.project_name].jira_base_url %}
+                                    {% if show_jira %}
                                         <span class="jira-count" onclick="toggleJiraTickets('{{ project.project_name }}-{{ env }}')">{{ env_data.jira_tickets|length }} tickets</span>
                                     {% endif %}
                                 </div>
@@ -469,17 +517,17 @@ class HTMLReportGenerator:
                                     {% if env_data.commits %}
                                         <span class="toggle-icon" id="commits-icon-{{ project.project_name }}-{{ env }}" onclick="toggleCommits('{{ project.project_name }}-{{ env }}')">▼</span>
                                     {% endif %}
-                                    {% if env_data.jira_tickets and project.project_name in project_configs and project_configs[project.project_name].jira_base_url %}
+                                    {% if show_jira %}
                                         <span class="toggle-icon" id="jira-icon-{{ project.project_name }}-{{ env }}" onclick="toggleJiraTickets('{{ project.project_name }}-{{ env }}')">🎫</span>
                                     {% endif %}
                                 </div>
                             </div>
                             
-                            {% if env_data.jira_tickets and project.project_name in project_configs and project_configs[project.project_name].jira_base_url %}
+                            {% if show_jira %}
                                 <div class="jira-tickets" id="jira-{{ project.project_name }}-{{ env }}">
                                     <h4>🎫 JIRA Tickets:</h4>
                                     {% for ticket in env_data.jira_tickets %}
-                                        <a href="{{ project_configs[project.project_name].jira_base_url }}/browse/{{ ticket }}" 
+                                        <a href="{{ jira_base_url }}/browse/{{ ticket }}" 
                                            target="_blank" class="jira-ticket">{{ ticket }}</a>
                                     {% endfor %}
                                 </div>
@@ -697,4 +745,34 @@ class HTMLReportGenerator:
 </body>
 </html>
         '''
-        return Template(template_str)
\ No newline at end of file
+
+# Report Jinja environments per bytecode cache directory
+_environments: Dict[Optional[str], Environment] = {}
+
+
+def _bytecode_cache(cache_dir: Optional[str]) -> Optional[FileSystemBytecodeCache]:
+    """Cache compiled template bytecode in cache_dir, if it is usable."""
+    try:
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            if not os.access(cache_dir, os.W_OK):
+                raise OSError(f"{cache_dir} is not writable")
+        # Without a directory, Jinja creates one owner-only and refuses one it cannot trust
+        return FileSystemBytecodeCache(cache_dir, pattern='release_tracker_report_%s.cache')
+    except (OSError, RuntimeError) as e:
+        logging.getLogger(__name__).debug(f"Report template bytecode cache disabled: {e}")
+        return None
+
+
+def _report_environment(cache_dir: Optional[str] = None) -> Environment:
+    """Build the report Jinja environment for a bytecode cache directory on first use."""
+    environment = _environments.get(cache_dir)
+    if environment is None:
+        # Commit messages and authors are escaped as they are written into the page
+        environment = Environment(
+            loader=DictLoader({REPORT_TEMPLATE_NAME: REPORT_TEMPLATE}),
+            autoescape=select_autoescape(['html']),
+            bytecode_cache=_bytecode_cache(cache_dir),
+        )
+        _environments[cache_dir] = environment
+    return environment
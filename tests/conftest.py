@@ -0,0 +1,30 @@
+import pytest
+from unittest.mock import Mock
+from git import Repo
+
+from release_trucker.git_manager import GitManager
+
+
+@pytest.fixture
+def mock_repo():
+    """A Repo stand-in that rejects attributes git.Repo does not have."""
+    return Mock(spec=Repo)
+
+
+@pytest.fixture
+def make_git_manager_mock(mock_repo):
+    """
+    Factory for GitManager stand-ins that hand out mock_repo and find no commits.
+    
+    Keyword arguments use configure_mock syntax, e.g.
+    make_git_manager_mock(**{'get_commits_between.return_value': commits}).
+    """
+    def make(**overrides):
+        attributes = {
+            'get_or_update_repo.return_value': mock_repo,
+            'commit_exists.return_value': True,
+            'get_commits_between.return_value': [],
+        }
+        attributes.update(overrides)
+        return Mock(spec_set=GitManager, **attributes)
+    return make
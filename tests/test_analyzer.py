@@ -1,4 +1,5 @@
 import pytest
+import threading
 from unittest.mock import Mock, patch, MagicMock
 from git import Repo
 
@@ -166,8 +167,27 @@ class TestReleaseAnalyzer:
         
         assert result is None
     
-    def test_get_environment_specific_commits_prod_baseline(self):
-        mock_repo = Mock()
+    def test_fetch_version_infos_concurrently_in_env_order(self):
+        project_config = ProjectConfig(
+            name="test-project",
+            repoUrl="https://github.com/test/repo.git",
+            env={"PROD": "https://prod.example.com", "DEV": "https://dev.example.com"}
+        )
+        # Both fetches must be in flight at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def get_version_info(url, env, verify_ssl=True, use_version_fallback=True):
+            barrier.wait()
+            return VersionInfo("1.0.0", f"{env.lower()}123", env)
+        
+        self.analyzer.api_client = Mock()
+        self.analyzer.api_client.get_version_info.side_effect = get_version_info
+        
+        result = self.analyzer._fetch_version_infos(project_config)
+        
+        assert [(env, info.commit_id) for env, info in result] == [("PROD", "prod123"), ("DEV", "dev123")]
+    
+    def test_get_environment_specific_commits_prod_baseline(self, mock_repo):
         version_infos = {
             "PROD": VersionInfo("1.0.0", "prod123", "PROD")
         }
@@ -179,8 +199,7 @@ class TestReleaseAnalyzer:
         
         assert result == []
     
-    def test_get_environment_specific_commits_pre_vs_prod(self):
-        mock_repo = Mock()
+    def test_get_environment_specific_commits_pre_vs_prod(self, mock_repo):
         version_infos = {
             "PROD": VersionInfo("1.0.0", "prod123", "PROD"),
             "PRE": VersionInfo("1.1.0", "pre456", "PRE")
@@ -200,8 +219,7 @@ class TestReleaseAnalyzer:
             mock_repo, "prod123", "pre456", expand_merges=True
         )
     
-    def test_get_environment_specific_commits_no_baseline(self):
-        mock_repo = Mock()
+    def test_get_environment_specific_commits_no_baseline(self, mock_repo):
         version_infos = {
             "DEV": VersionInfo("1.3.0", "dev000", "DEV")
         }
@@ -220,8 +238,7 @@ class TestReleaseAnalyzer:
             mock_repo, "HEAD~100", "dev000", expand_merges=True
         )
     
-    def test_get_environment_specific_commits_invalid_env(self):
-        mock_repo = Mock()
+    def test_get_environment_specific_commits_invalid_env(self, mock_repo):
         version_infos = {}
         env_order = ["DEV", "TEST", "PRE", "PROD"]
         
@@ -317,6 +334,13 @@ class TestProjectAnalysis:
         )
         
         assert analysis.environment_order == custom_order
+    
+    def test_analysis_dataclasses_are_slotted(self):
+        env_commits = EnvironmentCommits("PROD", "1.0.0", "prod123", [])
+        analysis = ProjectAnalysis("test-project", {"PROD": env_commits})
+        
+        assert not hasattr(env_commits, "__dict__")
+        assert not hasattr(analysis, "__dict__")
 
 
 class TestEnvironmentCommits:
@@ -6,6 +6,16 @@ from unittest.mock import Mock, patch
 from release_trucker.api_client import ActuatorClient, VersionInfo
 
 
+def register_actuator(url, version, commit_id, status=200):
+    """Mock a standard Spring Boot /actuator/info response."""
+    responses.add(
+        responses.GET,
+        url,
+        json={'build': {'version': version}, 'git': {'commit': {'id': commit_id}}},
+        status=status
+    )
+
+
 class TestActuatorClient:
     
     def setup_method(self):
@@ -14,15 +24,7 @@ class TestActuatorClient:
     @responses.activate
     def test_get_version_info_success(self):
         base_url = "https://api.example.com"
-        responses.add(
-            responses.GET,
-            f"{base_url}/actuator/info",
-            json={
-                "build": {"version": "2.1.0"},
-                "git": {"commit": {"id": "abc123def456"}}
-            },
-            status=200
-        )
+        register_actuator(f"{base_url}/actuator/info", "2.1.0", "abc123def456")
         
         result = self.client.get_version_info(base_url, "PROD")
         
@@ -167,15 +169,7 @@ class TestActuatorClient:
     @responses.activate 
     def test_get_version_info_url_with_trailing_slash(self):
         base_url = "https://api.example.com/"
-        responses.add(
-            responses.GET,
-            "https://api.example.com/actuator/info",
-            json={
-                "build": {"version": "1.0.0"},
-                "git": {"commit": {"id": "abc123"}}
-            },
-            status=200
-        )
+        register_actuator("https://api.example.com/actuator/info", "1.0.0", "abc123")
         
         result = self.client.get_version_info(base_url, "PROD")
         
@@ -185,15 +179,7 @@ class TestActuatorClient:
     @responses.activate
     def test_get_version_info_ssl_verification_disabled(self):
         base_url = "https://api.example.com"
-        responses.add(
-            responses.GET,
-            f"{base_url}/actuator/info",
-            json={
-                "build": {"version": "1.0.0"},
-                "git": {"commit": {"id": "abc123"}}
-            },
-            status=200
-        )
+        register_actuator(f"{base_url}/actuator/info", "1.0.0", "abc123")
         
         result = self.client.get_version_info(base_url, "PROD", verify_ssl=False)
         
@@ -205,15 +191,7 @@ class TestActuatorClient:
     @responses.activate
     def test_get_version_info_ssl_verification_enabled_default(self):
         base_url = "https://api.example.com"
-        responses.add(
-            responses.GET,
-            f"{base_url}/actuator/info",
-            json={
-                "build": {"version": "1.0.0"},
-                "git": {"commit": {"id": "abc123"}}
-            },
-            status=200
-        )
+        register_actuator(f"{base_url}/actuator/info", "1.0.0", "abc123")
         
         # Test that SSL verification is enabled by default
         result = self.client.get_version_info(base_url, "PROD")
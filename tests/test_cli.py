@@ -1,35 +1,55 @@
 import pytest
-import tempfile
+import threading
 import yaml
-from pathlib import Path
 from unittest.mock import Mock, patch
 from click.testing import CliRunner
 
-from release_trucker.cli import cli
+from release_trucker.cli import cli, analyze_projects
+from release_trucker.analyzer import ReleaseAnalyzer
+from release_trucker.csv_report_generator import CSVReportGenerator
+from release_trucker.git_manager import GitManager
+from release_trucker.report_generator import HTMLReportGenerator
+
+
+# Configs shared by most tests, serialized once at import time
+TEST_PROJECT_CONFIG = yaml.safe_dump({
+    'projects': [
+        {
+            'name': 'test-project',
+            'repoUrl': 'https://github.com/test/repo.git',
+            'env': {'PROD': 'https://prod.example.com'}
+        }
+    ]
+}).encode('utf-8')
+
+EMPTY_CONFIG = yaml.safe_dump({'projects': []}).encode('utf-8')
 
 
 class TestCLI:
     
-    def setup_method(self):
-        self.runner = CliRunner()
-        self.temp_dir = Path(tempfile.mkdtemp())
+    # CliRunner keeps no state between invoke() calls, so one instance is shared
+    runner = CliRunner()
     
-    def teardown_method(self):
-        import shutil
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def temp_dir(self, tmp_path):
+        # pytest owns tmp_path and prunes old runs in bulk
+        self.temp_dir = tmp_path
+        return tmp_path
     
     def create_test_config(self, config_data):
+        """Write a config file from a dict or pre-encoded YAML bytes."""
+        if not isinstance(config_data, bytes):
+            config_data = yaml.safe_dump(config_data).encode('utf-8')
         config_file = self.temp_dir / "test_config.yaml"
-        with open(config_file, 'w') as f:
-            yaml.dump(config_data, f)
+        config_file.write_bytes(config_data)
         return str(config_file)
     
     @patch('release_trucker.cli.ReleaseAnalyzer')
     @patch('release_trucker.cli.HTMLReportGenerator')
     def test_analyze_command_success(self, mock_report_gen_class, mock_analyzer_class):
         # Setup mocks
-        mock_analyzer = Mock()
-        mock_report_gen = Mock()
+        mock_analyzer = Mock(spec=ReleaseAnalyzer)
+        mock_report_gen = Mock(spec=HTMLReportGenerator)
         mock_analyzer_class.return_value = mock_analyzer
         mock_report_gen_class.return_value = mock_report_gen
         
@@ -39,16 +59,7 @@ class TestCLI:
         mock_analyzer.analyze_project.return_value = mock_analysis
         
         # Create test config
-        config_data = {
-            'projects': [
-                {
-                    'name': 'test-project',
-                    'repoUrl': 'https://github.com/test/repo.git',
-                    'env': {'PROD': 'https://prod.example.com'}
-                }
-            ]
-        }
-        config_file = self.create_test_config(config_data)
+        config_file = self.create_test_config(TEST_PROJECT_CONFIG)
         output_file = str(self.temp_dir / "test_report.html")
         
         # Run CLI
@@ -78,7 +89,7 @@ class TestCLI:
     
     @patch('release_trucker.cli.ReleaseAnalyzer')
     def test_analyze_no_successful_analyses(self, mock_analyzer_class):
-        mock_analyzer = Mock()
+        mock_analyzer = Mock(spec=ReleaseAnalyzer)
         mock_analyzer_class.return_value = mock_analyzer
         mock_analyzer.analyze_project.return_value = None  # All analyses fail
         
@@ -104,24 +115,15 @@ class TestCLI:
     @patch('release_trucker.cli.ReleaseAnalyzer')
     @patch('release_trucker.cli.HTMLReportGenerator')
     def test_analyze_with_verbose_logging(self, mock_report_gen_class, mock_analyzer_class):
-        mock_analyzer = Mock()
-        mock_report_gen = Mock()
+        mock_analyzer = Mock(spec=ReleaseAnalyzer)
+        mock_report_gen = Mock(spec=HTMLReportGenerator)
         mock_analyzer_class.return_value = mock_analyzer
         mock_report_gen_class.return_value = mock_report_gen
         
         mock_analysis = Mock()
         mock_analyzer.analyze_project.return_value = mock_analysis
         
-        config_data = {
-            'projects': [
-                {
-                    'name': 'test-project',
-                    'repoUrl': 'https://github.com/test/repo.git',
-                    'env': {'PROD': 'https://prod.example.com'}
-                }
-            ]
-        }
-        config_file = self.create_test_config(config_data)
+        config_file = self.create_test_config(TEST_PROJECT_CONFIG)
         
         result = self.runner.invoke(cli, [
             '--verbose',
@@ -134,24 +136,17 @@ class TestCLI:
     @patch('release_trucker.cli.ReleaseAnalyzer')
     @patch('release_trucker.cli.HTMLReportGenerator')
     def test_analyze_with_cleanup(self, mock_report_gen_class, mock_analyzer_class):
-        mock_analyzer = Mock()
-        mock_report_gen = Mock()
+        mock_analyzer = Mock(spec=ReleaseAnalyzer)
+        mock_report_gen = Mock(spec=HTMLReportGenerator)
         mock_analyzer_class.return_value = mock_analyzer
         mock_report_gen_class.return_value = mock_report_gen
         
         mock_analysis = Mock()
         mock_analyzer.analyze_project.return_value = mock_analysis
+        # git_manager is an instance attribute, so it is not part of the class spec
+        mock_analyzer.git_manager = Mock(spec=GitManager)
         
-        config_data = {
-            'projects': [
-                {
-                    'name': 'test-project',
-                    'repoUrl': 'https://github.com/test/repo.git',
-                    'env': {'PROD': 'https://prod.example.com'}
-                }
-            ]
-        }
-        config_file = self.create_test_config(config_data)
+        config_file = self.create_test_config(TEST_PROJECT_CONFIG)
         
         result = self.runner.invoke(cli, [
             'analyze',
@@ -174,8 +169,8 @@ class TestCLI:
     @patch('release_trucker.cli.ReleaseAnalyzer')
     @patch('release_trucker.cli.HTMLReportGenerator')
     def test_analyze_multiple_projects(self, mock_report_gen_class, mock_analyzer_class):
-        mock_analyzer = Mock()
-        mock_report_gen = Mock()
+        mock_analyzer = Mock(spec=ReleaseAnalyzer)
+        mock_report_gen = Mock(spec=HTMLReportGenerator)
         mock_analyzer_class.return_value = mock_analyzer
         mock_report_gen_class.return_value = mock_report_gen
         
@@ -221,11 +216,27 @@ class TestCLI:
         args = mock_report_gen.generate_report.call_args[0]
         assert len(args[0]) == 1  # Only one successful analysis
     
+    def test_analyze_projects_runs_concurrently_in_config_order(self):
+        projects = [Mock(), Mock(), Mock()]
+        for index, project in enumerate(projects):
+            project.name = f'project{index}'
+        # Every project must be in flight at once to get past the barrier
+        barrier = threading.Barrier(len(projects), timeout=5)
+        
+        def analyze_side_effect(project):
+            barrier.wait()
+            return None if project.name == 'project1' else project.name
+        
+        mock_analyzer = Mock(spec=ReleaseAnalyzer)
+        mock_analyzer.analyze_project.side_effect = analyze_side_effect
+        
+        assert analyze_projects(mock_analyzer, projects) == ['project0', 'project2']
+    
     @patch('release_trucker.cli.ReleaseAnalyzer')
     @patch('release_trucker.cli.HTMLReportGenerator')
     def test_analyze_report_generation_error(self, mock_report_gen_class, mock_analyzer_class):
-        mock_analyzer = Mock()
-        mock_report_gen = Mock()
+        mock_analyzer = Mock(spec=ReleaseAnalyzer)
+        mock_report_gen = Mock(spec=HTMLReportGenerator)
         mock_analyzer_class.return_value = mock_analyzer
         mock_report_gen_class.return_value = mock_report_gen
         
@@ -233,16 +244,7 @@ class TestCLI:
         mock_analyzer.analyze_project.return_value = mock_analysis
         mock_report_gen.generate_report.side_effect = Exception("Report generation failed")
         
-        config_data = {
-            'projects': [
-                {
-                    'name': 'test-project',
-                    'repoUrl': 'https://github.com/test/repo.git',
-                    'env': {'PROD': 'https://prod.example.com'}
-                }
-            ]
-        }
-        config_file = self.create_test_config(config_data)
+        config_file = self.create_test_config(TEST_PROJECT_CONFIG)
         
         result = self.runner.invoke(cli, [
             'analyze',
@@ -263,8 +265,7 @@ class TestCLI:
     @patch('release_trucker.cli.setup_logging')
     def test_logging_setup_verbose(self, mock_setup_logging):
         # Test that verbose flag affects logging setup
-        config_data = {'projects': []}
-        config_file = self.create_test_config(config_data)
+        config_file = self.create_test_config(EMPTY_CONFIG)
         
         # This will fail due to no projects, but we're testing logging setup
         self.runner.invoke(cli, [
@@ -277,8 +278,7 @@ class TestCLI:
     
     @patch('release_trucker.cli.setup_logging')
     def test_logging_setup_normal(self, mock_setup_logging):
-        config_data = {'projects': []}
-        config_file = self.create_test_config(config_data)
+        config_file = self.create_test_config(EMPTY_CONFIG)
         
         self.runner.invoke(cli, [
             'analyze',
@@ -306,16 +306,7 @@ class TestCLI:
         mock_release_manager.create_annotated_tag.return_value = True
         mock_release_manager.push_tag.return_value = True
         
-        config_data = {
-            'projects': [
-                {
-                    'name': 'test-project',
-                    'repoUrl': 'https://github.com/test/repo.git',
-                    'env': {'PROD': 'https://prod.example.com'}
-                }
-            ]
-        }
-        config_file = self.create_test_config(config_data)
+        config_file = self.create_test_config(TEST_PROJECT_CONFIG)
         
         # Mock user confirmations
         with patch('click.confirm', side_effect=[True, True]):  # Confirm branch and tag push
@@ -330,10 +321,10 @@ class TestCLI:
         assert '✅ Release prepared: release/BWD-123' in result.output
         assert '🏷️  New version: 1.0.0' in result.output
         mock_release_manager.prepare_release.assert_called_once()
+        mock_release_manager.close.assert_called_once()
     
     def test_release_command_invalid_jira_ticket(self):
-        config_data = {'projects': []}
-        config_file = self.create_test_config(config_data)
+        config_file = self.create_test_config(EMPTY_CONFIG)
         
         result = self.runner.invoke(cli, [
             'release',
@@ -360,16 +351,7 @@ class TestCLI:
         mock_release_manager_class.return_value = mock_release_manager
         mock_release_manager.prepare_release.return_value = None  # No release prepared
         
-        config_data = {
-            'projects': [
-                {
-                    'name': 'test-project',
-                    'repoUrl': 'https://github.com/test/repo.git',
-                    'env': {'PROD': 'https://prod.example.com'}
-                }
-            ]
-        }
-        config_file = self.create_test_config(config_data)
+        config_file = self.create_test_config(TEST_PROJECT_CONFIG)
         
         result = self.runner.invoke(cli, [
             'release',
@@ -398,16 +380,7 @@ class TestCLI:
         mock_release_manager.push_branch.return_value = False  # Push fails
         mock_release_manager.create_annotated_tag.return_value = False  # Tag creation fails
         
-        config_data = {
-            'projects': [
-                {
-                    'name': 'test-project',
-                    'repoUrl': 'https://github.com/test/repo.git',
-                    'env': {'PROD': 'https://prod.example.com'}
-                }
-            ]
-        }
-        config_file = self.create_test_config(config_data)
+        config_file = self.create_test_config(TEST_PROJECT_CONFIG)
         
         # Mock user confirmations
         with patch('click.confirm', return_value=True):
@@ -440,16 +413,7 @@ class TestCLI:
         mock_release_manager.push_branch.return_value = True  # Push succeeds
         mock_release_manager.create_annotated_tag.return_value = False  # Tag creation fails
         
-        config_data = {
-            'projects': [
-                {
-                    'name': 'test-project',
-                    'repoUrl': 'https://github.com/test/repo.git',
-                    'env': {'PROD': 'https://prod.example.com'}
-                }
-            ]
-        }
-        config_file = self.create_test_config(config_data)
+        config_file = self.create_test_config(TEST_PROJECT_CONFIG)
         
         # Mock user confirmations
         with patch('click.confirm', return_value=True):
@@ -469,9 +433,9 @@ class TestCLI:
     def test_analyze_with_csv_output(self, mock_csv_gen_class, mock_html_gen_class, mock_analyzer_class):
         """Test analyze command with CSV output."""
         # Setup mocks
-        mock_analyzer = Mock()
-        mock_html_gen = Mock()
-        mock_csv_gen = Mock()
+        mock_analyzer = Mock(spec=ReleaseAnalyzer)
+        mock_html_gen = Mock(spec=HTMLReportGenerator)
+        mock_csv_gen = Mock(spec=CSVReportGenerator)
         mock_analyzer_class.return_value = mock_analyzer
         mock_html_gen_class.return_value = mock_html_gen
         mock_csv_gen_class.return_value = mock_csv_gen
@@ -490,16 +454,7 @@ class TestCLI:
         }
         
         # Create test config
-        config_data = {
-            'projects': [
-                {
-                    'name': 'test-project',
-                    'repoUrl': 'https://github.com/test/repo.git',
-                    'env': {'PROD': 'https://prod.example.com'}
-                }
-            ]
-        }
-        config_file = self.create_test_config(config_data)
+        config_file = self.create_test_config(TEST_PROJECT_CONFIG)
         html_file = str(self.temp_dir / "test_report.html")
         csv_file = str(self.temp_dir / "test_tickets.csv")
 
@@ -529,8 +484,8 @@ class TestCLI:
     def test_analyze_csv_only(self, mock_csv_gen_class, mock_analyzer_class):
         """Test analyze command with CSV only (no HTML)."""
         # Setup mocks
-        mock_analyzer = Mock()
-        mock_csv_gen = Mock()
+        mock_analyzer = Mock(spec=ReleaseAnalyzer)
+        mock_csv_gen = Mock(spec=CSVReportGenerator)
         mock_analyzer_class.return_value = mock_analyzer
         mock_csv_gen_class.return_value = mock_csv_gen
         
@@ -584,8 +539,8 @@ class TestCLI:
     def test_analyze_csv_detailed_format(self, mock_csv_gen_class, mock_analyzer_class):
         """Test analyze command with detailed CSV format."""
         # Setup mocks
-        mock_analyzer = Mock()
-        mock_csv_gen = Mock()
+        mock_analyzer = Mock(spec=ReleaseAnalyzer)
+        mock_csv_gen = Mock(spec=CSVReportGenerator)
         mock_analyzer_class.return_value = mock_analyzer
         mock_csv_gen_class.return_value = mock_csv_gen
         
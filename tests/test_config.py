@@ -1,96 +1,96 @@
 import pytest
-import tempfile
 import yaml
-from pathlib import Path
 
 from release_trucker.config import load_config, Config, ProjectConfig
 
 
+# Config fixtures are small enough to keep as literal YAML rather than
+# serializing dicts with yaml.dump on every test.
+VALID_CONFIG_YAML = """\
+projects:
+- name: test-project
+  repoUrl: https://github.com/test/repo.git
+  env:
+    PROD: https://prod.example.com
+    PRE: https://pre.example.com
+    TEST: https://test.example.com
+    DEV: https://dev.example.com
+"""
+
+MULTIPLE_PROJECTS_YAML = """\
+projects:
+- name: project1
+  repoUrl: https://github.com/test/repo1.git
+  env:
+    PROD: https://prod1.com
+- name: project2
+  repoUrl: https://github.com/test/repo2.git
+  env:
+    PROD: https://prod2.com
+"""
+
+
+def single_project_yaml(name: str, extra: str = "") -> str:
+    """Build a one-project config with optional extra project-level keys."""
+    return (
+        "projects:\n"
+        f"- name: {name}\n"
+        "  repoUrl: https://github.com/test/repo.git\n"
+        "  env:\n"
+        "    PROD: https://prod.example.com\n"
+        f"{extra}"
+    )
+
+
+def assert_field_value(project: ProjectConfig, field: str, expected) -> None:
+    """Assert a config field value, by identity for bool and None so 0, "" or 1 don't pass."""
+    actual = getattr(project, field)
+    if expected is None or isinstance(expected, bool):
+        assert actual is expected
+    else:
+        assert actual == expected
+
+
 class TestConfig:
     
-    def create_test_config(self, config_data):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            return f.name
+    def create_test_config(self, tmp_path, config_text):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(config_text)
+        return str(config_file)
     
-    def test_load_config_valid(self):
-        config_data = {
-            'projects': [
-                {
-                    'name': 'test-project',
-                    'repoUrl': 'https://github.com/test/repo.git',
-                    'env': {
-                        'PROD': 'https://prod.example.com',
-                        'PRE': 'https://pre.example.com',
-                        'TEST': 'https://test.example.com',
-                        'DEV': 'https://dev.example.com'
-                    }
-                }
-            ]
-        }
+    def test_load_config_valid(self, tmp_path):
+        config_path = self.create_test_config(tmp_path, VALID_CONFIG_YAML)
+        
+        config = load_config(config_path)
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
+        assert isinstance(config, Config)
+        assert len(config.projects) == 1
         
-        try:
-            config = load_config(config_path)
-            
-            assert isinstance(config, Config)
-            assert len(config.projects) == 1
-            
-            project = config.projects[0]
-            assert isinstance(project, ProjectConfig)
-            assert project.name == 'test-project'
-            assert project.repoUrl == 'https://github.com/test/repo.git'
-            assert project.env['PROD'] == 'https://prod.example.com'
-            assert project.env['DEV'] == 'https://dev.example.com'
-        finally:
-            Path(config_path).unlink()
+        project = config.projects[0]
+        assert isinstance(project, ProjectConfig)
+        assert project.name == 'test-project'
+        assert project.repoUrl == 'https://github.com/test/repo.git'
+        assert project.env['PROD'] == 'https://prod.example.com'
+        assert project.env['DEV'] == 'https://dev.example.com'
     
-    def test_load_config_multiple_projects(self):
-        config_data = {
-            'projects': [
-                {
-                    'name': 'project1',
-                    'repoUrl': 'https://github.com/test/repo1.git',
-                    'env': {'PROD': 'https://prod1.com'}
-                },
-                {
-                    'name': 'project2',
-                    'repoUrl': 'https://github.com/test/repo2.git',
-                    'env': {'PROD': 'https://prod2.com'}
-                }
-            ]
-        }
+    def test_load_config_multiple_projects(self, tmp_path):
+        config_path = self.create_test_config(tmp_path, MULTIPLE_PROJECTS_YAML)
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
+        config = load_config(config_path)
         
-        try:
-            config = load_config(config_path)
-            
-            assert len(config.projects) == 2
-            assert config.projects[0].name == 'project1'
-            assert config.projects[1].name == 'project2'
-        finally:
-            Path(config_path).unlink()
+        assert len(config.projects) == 2
+        assert config.projects[0].name == 'project1'
+        assert config.projects[1].name == 'project2'
     
     def test_load_config_file_not_found(self):
         with pytest.raises(FileNotFoundError):
             load_config('nonexistent.yaml')
     
-    def test_load_config_invalid_yaml(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write('invalid: yaml: content:')
-            config_path = f.name
+    def test_load_config_invalid_yaml(self, tmp_path):
+        config_path = self.create_test_config(tmp_path, 'invalid: yaml: content:')
         
-        try:
-            with pytest.raises(yaml.YAMLError):
-                load_config(config_path)
-        finally:
-            Path(config_path).unlink()
+        with pytest.raises(yaml.YAMLError):
+            load_config(config_path)
     
     def test_project_config_creation(self):
         project = ProjectConfig(
@@ -117,206 +117,49 @@ class TestConfig:
         assert config.projects[0].name == 'proj1'
         assert config.projects[1].name == 'proj2'
     
-    def test_load_config_with_ssl_verification_disabled(self):
-        config_data = {
-            'projects': [
-                {
-                    'name': 'insecure-project',
-                    'repoUrl': 'https://github.com/test/repo.git',
-                    'env': {
-                        'PROD': 'https://prod.example.com'
-                    },
-                    'verify_ssl': False
-                }
-            ]
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
-        
-        try:
-            config = load_config(config_path)
-            
-            assert len(config.projects) == 1
-            project = config.projects[0]
-            assert project.name == 'insecure-project'
-            assert project.verify_ssl is False
-        finally:
-            Path(config_path).unlink()
-    
-    def test_load_config_ssl_verification_default_true(self):
-        config_data = {
-            'projects': [
-                {
-                    'name': 'secure-project',
-                    'repoUrl': 'https://github.com/test/repo.git',
-                    'env': {
-                        'PROD': 'https://prod.example.com'
-                    }
-                    # No verify_ssl specified, should default to True
-                }
-            ]
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
-        
-        try:
-            config = load_config(config_path)
-            
-            assert len(config.projects) == 1
-            project = config.projects[0]
-            assert project.name == 'secure-project'
-            assert project.verify_ssl is True  # Should default to True
-        finally:
-            Path(config_path).unlink()
-    
-    def test_project_config_creation_with_ssl_options(self):
-        # Test with SSL verification disabled
-        project1 = ProjectConfig(
-            name='insecure-project',
-            repoUrl='https://github.com/test/repo.git',
-            env={'PROD': 'https://prod.example.com'},
-            verify_ssl=False
-        )
-        
-        assert project1.verify_ssl is False
-        
-        # Test with SSL verification enabled (default)
-        project2 = ProjectConfig(
-            name='secure-project',
-            repoUrl='https://github.com/test/repo.git',
-            env={'PROD': 'https://prod.example.com'}
-        )
-        
-        assert project2.verify_ssl is True
-    
-    def test_load_config_with_version_fallback_disabled(self):
-        config_data = {
-            'projects': [
-                {
-                    'name': 'fallback-disabled-project',
-                    'repoUrl': 'https://github.com/test/repo.git',
-                    'env': {
-                        'PROD': 'https://prod.example.com'
-                    },
-                    'use_version_fallback': False
-                }
-            ]
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
-        
-        try:
-            config = load_config(config_path)
-            
-            assert len(config.projects) == 1
-            project = config.projects[0]
-            assert project.name == 'fallback-disabled-project'
-            assert project.use_version_fallback is False
-        finally:
-            Path(config_path).unlink()
-    
-    def test_load_config_version_fallback_default_true(self):
-        config_data = {
-            'projects': [
-                {
-                    'name': 'fallback-default-project',
-                    'repoUrl': 'https://github.com/test/repo.git',
-                    'env': {
-                        'PROD': 'https://prod.example.com'
-                    }
-                    # No use_version_fallback specified, should default to True
-                }
-            ]
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
-        
-        try:
-            config = load_config(config_path)
-            
-            assert len(config.projects) == 1
-            project = config.projects[0]
-            assert project.name == 'fallback-default-project'
-            assert project.use_version_fallback is True  # Should default to True
-        finally:
-            Path(config_path).unlink()
-    
-    def test_project_config_creation_with_version_fallback_options(self):
-        # Test with version fallback disabled
+    @pytest.mark.parametrize('extra, field, expected', [
+        ('  verify_ssl: false\n', 'verify_ssl', False),
+        ('', 'verify_ssl', True),
+        ('  use_version_fallback: false\n', 'use_version_fallback', False),
+        ('', 'use_version_fallback', True),
+        ('  jira_base_url: https://company.atlassian.net\n', 'jira_base_url', 'https://company.atlassian.net'),
+        ('', 'jira_base_url', None),
+    ], ids=[
+        'ssl-disabled', 'ssl-default-true',
+        'version-fallback-disabled', 'version-fallback-default-true',
+        'jira-base-url', 'jira-base-url-default-none',
+    ])
+    def test_load_config_optional_fields(self, tmp_path, extra, field, expected):
+        config_path = self.create_test_config(tmp_path, single_project_yaml('test-project', extra))
+        
+        config = load_config(config_path)
+        
+        assert len(config.projects) == 1
+        project = config.projects[0]
+        assert project.name == 'test-project'
+        assert_field_value(project, field, expected)
+    
+    @pytest.mark.parametrize('field, value, default', [
+        ('verify_ssl', False, True),
+        ('use_version_fallback', False, True),
+        ('jira_base_url', 'https://mycompany.atlassian.net', None),
+    ])
+    def test_project_config_creation_with_optional_fields(self, field, value, default):
+        # Explicitly set value
         project1 = ProjectConfig(
-            name='fallback-disabled',
+            name='test-project',
             repoUrl='https://github.com/test/repo.git',
             env={'PROD': 'https://prod.example.com'},
-            use_version_fallback=False
+            **{field: value}
         )
         
-        assert project1.use_version_fallback is False
+        assert_field_value(project1, field, value)
         
-        # Test with version fallback enabled (default)
+        # Default value
         project2 = ProjectConfig(
-            name='fallback-enabled',
+            name='test-project',
             repoUrl='https://github.com/test/repo.git',
             env={'PROD': 'https://prod.example.com'}
         )
         
-        assert project2.use_version_fallback is True
-    
-    def test_load_config_with_jira_base_url(self):
-        config_data = {
-            'projects': [
-                {
-                    'name': 'test-project',
-                    'repoUrl': 'https://github.com/test/repo.git',
-                    'env': {'PROD': 'https://prod.example.com'},
-                    'jira_base_url': 'https://company.atlassian.net'
-                }
-            ]
-        }
-        config_file = self.create_test_config(config_data)
-        
-        try:
-            config = load_config(config_file)
-            
-            assert len(config.projects) == 1
-            assert config.projects[0].jira_base_url == 'https://company.atlassian.net'
-        finally:
-            Path(config_file).unlink()
-    
-    def test_load_config_jira_base_url_default_none(self):
-        config_data = {
-            'projects': [
-                {
-                    'name': 'test-project',
-                    'repoUrl': 'https://github.com/test/repo.git',
-                    'env': {'PROD': 'https://prod.example.com'}
-                }
-            ]
-        }
-        config_file = self.create_test_config(config_data)
-        
-        try:
-            config = load_config(config_file)
-            
-            assert len(config.projects) == 1
-            assert config.projects[0].jira_base_url is None
-        finally:
-            Path(config_file).unlink()
-    
-    def test_project_config_creation_with_jira_options(self):
-        project = ProjectConfig(
-            name="test-project",
-            repoUrl="https://github.com/test/repo.git",
-            env={"PROD": "https://prod.example.com"},
-            jira_base_url="https://mycompany.atlassian.net"
-        )
-        
-        assert project.name == "test-project"
-        assert project.jira_base_url == "https://mycompany.atlassian.net"
\ No newline at end of file
+        assert_field_value(project2, field, default)
@@ -1,7 +1,6 @@
 import pytest
-import tempfile
 import csv
-from pathlib import Path
+from dataclasses import replace
 from unittest.mock import Mock
 from datetime import datetime
 
@@ -9,64 +8,72 @@ from release_trucker.csv_report_generator import CSVReportGenerator, JiraTicketS
 from release_trucker.analyzer import ProjectAnalysis, EnvironmentCommits
 
 
-class TestCSVReportGenerator:
-    
-    def setup_method(self):
-        self.generator = CSVReportGenerator()
-        self.temp_dir = Path(tempfile.mkdtemp())
-    
-    def teardown_method(self):
-        import shutil
-        shutil.rmtree(self.temp_dir)
-    
-    def create_mock_analysis(self, project_name: str, environments_data: dict) -> ProjectAnalysis:
-        """Create a mock ProjectAnalysis with test data."""
-        environments = {}
-        for env_name, env_data in environments_data.items():
-            # Create mock commits with JIRA tickets
-            commits = []
-            for ticket_id in env_data.get('tickets', []):
-                commits.append({
-                    'id': f'commit_{ticket_id}',
-                    'message': f'{ticket_id}: Test commit message for {ticket_id}',
-                    'date': env_data.get('date', '2024-01-15T10:00:00'),
-                    'author': 'test@example.com',
-                    'summary': f'{ticket_id}: Test commit'
-                })
-            
-            # Create EnvironmentCommits
-            env_commits = EnvironmentCommits(
-                environment=env_name,
-                version=env_data.get('version', '1.0.0'),
-                commit_id=f'commit_{env_name}',
-                commits=commits,
-                jira_tickets=set(env_data.get('tickets', []))
-            )
-            environments[env_name] = env_commits
-        
-        return ProjectAnalysis(
-            project_name=project_name,
-            environments=environments,
-            environment_order=["DEV", "TEST", "PRE", "PROD"]
+def create_mock_analysis(project_name: str, environments_data: dict) -> ProjectAnalysis:
+    """Create a mock ProjectAnalysis with test data."""
+    environments = {}
+    for env_name, env_data in environments_data.items():
+        # Create mock commits with JIRA tickets
+        commits = []
+        for ticket_id in env_data.get('tickets', []):
+            commits.append({
+                'id': f'commit_{ticket_id}',
+                'message': f'{ticket_id}: Test commit message for {ticket_id}',
+                'date': env_data.get('date', '2024-01-15T10:00:00'),
+                'author': 'test@example.com',
+                'summary': f'{ticket_id}: Test commit'
+            })
+
+        # Create EnvironmentCommits
+        env_commits = EnvironmentCommits(
+            environment=env_name,
+            version=env_data.get('version', '1.0.0'),
+            commit_id=f'commit_{env_name}',
+            commits=commits,
+            jira_tickets=set(env_data.get('tickets', []))
         )
+        environments[env_name] = env_commits
+
+    return ProjectAnalysis(
+        project_name=project_name,
+        environments=environments,
+        environment_order=["DEV", "TEST", "PRE", "PROD"]
+    )
+
+
+@pytest.fixture(scope="module")
+def bwd_123_analysis() -> ProjectAnalysis:
+    """BWD-123 deployed to DEV and TEST; shared read-only by tests that need this shape."""
+    return create_mock_analysis('frontend-app', {
+        'DEV': {'version': '2.1.0', 'tickets': ['BWD-123'], 'date': '2024-01-15T10:00:00'},
+        'TEST': {'version': '2.0.0', 'tickets': ['BWD-123'], 'date': '2024-01-10T10:00:00'},
+    })
+
+
+@pytest.fixture(scope="module")
+def generator():
+    """CSVReportGenerator keeps no per-report state, so one instance is shared."""
+    return CSVReportGenerator()
+
+
+class TestCSVReportGenerator:
     
-    def test_generate_summary_csv_report(self):
+    def test_generate_summary_csv_report(self, generator, tmp_path):
         """Test generating summary CSV report."""
         # Create mock analyses
         analyses = [
-            self.create_mock_analysis('frontend-app', {
+            create_mock_analysis('frontend-app', {
                 'DEV': {'version': '2.1.0', 'tickets': ['BWD-123', 'AUTH-456'], 'date': '2024-01-15T10:00:00'},
                 'TEST': {'version': '2.0.0', 'tickets': ['BWD-123'], 'date': '2024-01-10T10:00:00'},
             }),
-            self.create_mock_analysis('backend-api', {
+            create_mock_analysis('backend-api', {
                 'DEV': {'version': '1.5.0', 'tickets': ['AUTH-456', 'FEAT-789'], 'date': '2024-01-12T10:00:00'},
                 'PROD': {'version': '1.0.0', 'tickets': ['FEAT-789'], 'date': '2024-01-05T10:00:00'},
             })
         ]
         
         # Generate CSV report
-        csv_file = self.temp_dir / "summary_test.csv"
-        self.generator.generate_csv_report(analyses, str(csv_file), "summary")
+        csv_file = tmp_path / "summary_test.csv"
+        generator.generate_csv_report(analyses, str(csv_file), "summary")
         
         # Verify file was created
         assert csv_file.exists()
@@ -95,19 +102,13 @@ class TestCSVReportGenerator:
         assert bwd_123_row['PROD'] == 'No'
         assert bwd_123_row['Total_Environments'] == '2'
     
-    def test_generate_detailed_csv_report(self):
+    def test_generate_detailed_csv_report(self, generator, tmp_path, bwd_123_analysis):
         """Test generating detailed CSV report."""
-        # Create mock analysis
-        analyses = [
-            self.create_mock_analysis('test-project', {
-                'DEV': {'version': '2.0.0', 'tickets': ['BWD-123'], 'date': '2024-01-15T10:00:00'},
-                'TEST': {'version': '1.5.0', 'tickets': ['BWD-123'], 'date': '2024-01-10T10:00:00'},
-            })
-        ]
+        analyses = [replace(bwd_123_analysis, project_name='test-project')]
         
         # Generate CSV report
-        csv_file = self.temp_dir / "detailed_test.csv"
-        self.generator.generate_csv_report(analyses, str(csv_file), "detailed")
+        csv_file = tmp_path / "detailed_test.csv"
+        generator.generate_csv_report(analyses, str(csv_file), "detailed")
         
         # Verify file was created
         assert csv_file.exists()
@@ -130,34 +131,34 @@ class TestCSVReportGenerator:
         assert first_row['JIRA_Ticket'] == 'BWD-123'
         assert first_row['Project'] == 'test-project'
         assert first_row['Environment'] in ['DEV', 'TEST']
-        assert first_row['Version'] in ['2.0.0', '1.5.0']
+        assert first_row['Version'] in ['2.1.0', '2.0.0']
         assert first_row['Commit_Message'].startswith('BWD-123: Test commit message')
     
-    def test_invalid_format_raises_error(self):
+    def test_invalid_format_raises_error(self, generator, tmp_path):
         """Test that invalid format raises ValueError."""
         analyses = []
-        csv_file = self.temp_dir / "invalid_test.csv"
+        csv_file = tmp_path / "invalid_test.csv"
         
         with pytest.raises(ValueError, match="Unsupported CSV format: invalid"):
-            self.generator.generate_csv_report(analyses, str(csv_file), "invalid")
+            generator.generate_csv_report(analyses, str(csv_file), "invalid")
     
-    def test_get_ticket_statistics(self):
+    def test_get_ticket_statistics(self, generator):
         """Test ticket statistics calculation."""
         # Create mock analyses with various ticket distributions
         analyses = [
-            self.create_mock_analysis('frontend-app', {
+            create_mock_analysis('frontend-app', {
                 'DEV': {'tickets': ['BWD-123', 'AUTH-456']},
                 'TEST': {'tickets': ['BWD-123']},
                 'PROD': {'tickets': ['OLD-999']},
             }),
-            self.create_mock_analysis('backend-api', {
+            create_mock_analysis('backend-api', {
                 'DEV': {'tickets': ['AUTH-456', 'FEAT-789']},
                 'PROD': {'tickets': ['FEAT-789']},
             })
         ]
         
         # Get statistics
-        stats = self.generator.get_ticket_statistics(analyses)
+        stats = generator.get_ticket_statistics(analyses)
         
         # Verify statistics
         assert stats['total_tickets'] == 5  # BWD-123, AUTH-456, OLD-999, AUTH-456, FEAT-789
@@ -170,60 +171,53 @@ class TestCSVReportGenerator:
         # Check multi-environment tickets
         assert stats['multi_environment_tickets'] >= 1  # At least AUTH-456 is in multiple envs
     
-    def test_extract_jira_tickets_from_message(self):
+    @pytest.mark.parametrize("message, expected", [
+        # Valid ticket patterns
+        ("BWD-123: Fix bug", {'BWD-123'}),
+        ("AUTH-456 and FEAT-789: Multiple tickets", {'AUTH-456', 'FEAT-789'}),
+        ("Merge PR with ABC-1, DEF-22, GHI-333", {'ABC-1', 'DEF-22', 'GHI-333'}),
+        # Invalid patterns
+        ("bwd-123: lowercase", set()),
+        ("123-BWD: wrong order", set()),
+        ("TOOLONGPROJECTNAME-123: too long", set()),
+        # Edge cases
+        ("", set()),
+        ("No tickets here", set()),
+    ])
+    def test_extract_jira_tickets_from_message(self, generator, message, expected):
         """Test JIRA ticket extraction from commit messages."""
-        # Test valid ticket patterns
-        assert self.generator._extract_jira_tickets_from_message("BWD-123: Fix bug") == {'BWD-123'}
-        assert self.generator._extract_jira_tickets_from_message("AUTH-456 and FEAT-789: Multiple tickets") == {'AUTH-456', 'FEAT-789'}
-        assert self.generator._extract_jira_tickets_from_message("Merge PR with ABC-1, DEF-22, GHI-333") == {'ABC-1', 'DEF-22', 'GHI-333'}
-        
-        # Test invalid patterns
-        assert self.generator._extract_jira_tickets_from_message("bwd-123: lowercase") == set()
-        assert self.generator._extract_jira_tickets_from_message("123-BWD: wrong order") == set()
-        assert self.generator._extract_jira_tickets_from_message("TOOLONGPROJECTNAME-123: too long") == set()
-        
-        # Test edge cases
-        assert self.generator._extract_jira_tickets_from_message("") == set()
-        assert self.generator._extract_jira_tickets_from_message("No tickets here") == set()
+        assert generator._extract_jira_tickets_from_message(message) == expected
     
-    def test_clean_commit_message(self):
+    @pytest.mark.parametrize("message, expected", [
+        # Normal message
+        ("BWD-123: Fix authentication bug", "BWD-123: Fix authentication bug"),
+        # Newlines and extra whitespace
+        ("BWD-123: Fix bug\n\nThis fixes the issue\n   with extra spaces",
+         "BWD-123: Fix bug This fixes the issue with extra spaces"),
+        # Quotes should be escaped
+        ('BWD-123: Fix "quoted" issue', 'BWD-123: Fix ""quoted"" issue'),
+        # Empty message
+        ("", ""),
+        (None, ""),
+    ])
+    def test_clean_commit_message(self, generator, message, expected):
         """Test commit message cleaning for CSV output."""
-        # Test normal message
-        clean_msg = self.generator._clean_commit_message("BWD-123: Fix authentication bug")
-        assert clean_msg == "BWD-123: Fix authentication bug"
-        
-        # Test message with newlines and extra whitespace
-        messy_msg = "BWD-123: Fix bug\n\nThis fixes the issue\n   with extra spaces"
-        clean_msg = self.generator._clean_commit_message(messy_msg)
-        assert clean_msg == "BWD-123: Fix bug This fixes the issue with extra spaces"
-        
-        # Test very long message (should be truncated)
+        assert generator._clean_commit_message(message) == expected
+    
+    def test_clean_commit_message_truncates_long_message(self, generator):
+        """Test that very long commit messages are truncated."""
         long_msg = "BWD-123: " + "a" * 100
-        clean_msg = self.generator._clean_commit_message(long_msg)
+        clean_msg = generator._clean_commit_message(long_msg)
         assert len(clean_msg) <= 100
         assert clean_msg.endswith("...")
-        
-        # Test message with quotes (should be escaped)
-        quote_msg = 'BWD-123: Fix "quoted" issue'
-        clean_msg = self.generator._clean_commit_message(quote_msg)
-        assert clean_msg == 'BWD-123: Fix ""quoted"" issue'
-        
-        # Test empty message
-        assert self.generator._clean_commit_message("") == ""
-        assert self.generator._clean_commit_message(None) == ""
     
-    def test_collect_ticket_summaries(self):
+    def test_collect_ticket_summaries(self, generator, bwd_123_analysis):
         """Test ticket summary collection."""
-        # Create mock analysis with overlapping tickets
-        analyses = [
-            self.create_mock_analysis('frontend-app', {
-                'DEV': {'version': '2.1.0', 'tickets': ['BWD-123'], 'date': '2024-01-15T10:00:00'},
-                'TEST': {'version': '2.0.0', 'tickets': ['BWD-123'], 'date': '2024-01-10T10:00:00'},
-            })
-        ]
+        # Analysis with the same ticket in two environments
+        analyses = [bwd_123_analysis]
         
         # Collect summaries
-        summaries = self.generator._collect_ticket_summaries(analyses)
+        summaries = generator._collect_ticket_summaries(analyses)
         
         # Verify we get one summary for BWD-123
         assert len(summaries) == 1
@@ -237,17 +231,17 @@ class TestCSVReportGenerator:
         assert summary.first_seen_version == '2.0.0'  # Alphabetically first
         assert summary.latest_version == '2.1.0'  # Alphabetically last
     
-    def test_collect_ticket_details(self):
+    def test_collect_ticket_details(self, generator):
         """Test ticket detail collection."""
         # Create mock analysis
         analyses = [
-            self.create_mock_analysis('test-project', {
+            create_mock_analysis('test-project', {
                 'DEV': {'version': '1.1.0', 'tickets': ['BWD-123'], 'date': '2024-01-15T10:00:00'},
             })
         ]
         
         # Collect details
-        details = self.generator._collect_ticket_details(analyses)
+        details = generator._collect_ticket_details(analyses)
         
         # Verify we get one detail for BWD-123 in DEV
         assert len(details) == 1
@@ -261,11 +255,18 @@ class TestCSVReportGenerator:
         assert detail.commit_date == '2024-01-15'  # Just date part
         assert 'BWD-123: Test commit message' in detail.commit_message
     
-    def test_empty_analyses_list(self):
+    @pytest.mark.parametrize("format_type, expected_headers", [
+        ("summary", ['JIRA_Ticket', 'Project', 'DEV', 'TEST', 'PRE', 'PROD',
+                     'Total_Environments', 'First_Seen_Version', 'Latest_Version',
+                     'First_Commit_Date', 'Latest_Commit_Date']),
+        ("detailed", ['JIRA_Ticket', 'Project', 'Environment', 'Version',
+                      'Commit_ID', 'Commit_Date', 'Commit_Message']),
+    ])
+    def test_empty_analyses_list(self, generator, tmp_path, format_type, expected_headers):
         """Test handling of empty analyses list."""
         # Generate reports with empty list
-        csv_file = self.temp_dir / "empty_test.csv"
-        self.generator.generate_csv_report([], str(csv_file), "summary")
+        csv_file = tmp_path / "empty_test.csv"
+        generator.generate_csv_report([], str(csv_file), format_type)
         
         # Verify file was created but only has headers
         assert csv_file.exists()
@@ -274,4 +275,5 @@ class TestCSVReportGenerator:
             reader = csv.DictReader(f)
             rows = list(reader)
         
-        assert len(rows) == 0  # No data rows, only headers
\ No newline at end of file
+        assert len(rows) == 0  # No data rows, only headers
+        assert reader.fieldnames == expected_headers
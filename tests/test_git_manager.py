@@ -1,116 +1,180 @@
 import pytest
-import tempfile
 import shutil
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-from git import Repo, GitCommandError
+from collections import namedtuple
+from types import SimpleNamespace
+from unittest.mock import Mock, MagicMock, PropertyMock
+from git import Actor, Repo, GitCommandError
 
 from release_trucker.git_manager import GitManager
 
 
-class TestGitManager:
+# Both the specific and the catch-all error paths must fail soft
+GIT_ERRORS = [
+    pytest.param(GitCommandError("git", 1), id="git-error"),
+    pytest.param(Exception("Unexpected error"), id="unexpected-error"),
+]
+
+# tag_exists only reads .name
+Tag = namedtuple("Tag", "name")
+
+# Shared commit parents: expansion reads len(parents) and each merged parent's hexsha
+MERGE_PARENTS = (SimpleNamespace(hexsha="main0001"), SimpleNamespace(hexsha="branch01"))
+SINGLE_PARENT = (SimpleNamespace(hexsha="main0001"),)
+
+
+def _git_commit(hexsha, message="", author="Developer", date="2023-01-01T12:00:00",
+                parents=SINGLE_PARENT):
+    """A read-only stand-in for git.Commit carrying the attributes GitManager reads."""
+    return SimpleNamespace(hexsha=hexsha, message=message, summary=message.strip(),
+                           author=author, parents=parents,
+                           committed_datetime=SimpleNamespace(isoformat=lambda: date))
+
+
+# Commits returned by iter_commits; shared read-only across tests
+SAMPLE_COMMITS = (
+    _git_commit("abc123def456", "First commit\n", author="John Doe"),
+    _git_commit("def456ghi789", "Second commit\n", author="Jane Smith", date="2023-01-02T12:00:00"),
+)
+FEATURE_COMMITS = (
+    _git_commit("feature1", "Add new feature", date="2023-01-01T10:00:00"),
+    _git_commit("feature2", "Fix feature bug", date="2023-01-01T11:00:00"),
+)
+
+
+def _commit_dict(id="c", msg="m", author="a", date="2023-01-01T12:00:00"):
+    """Build a commit dict shaped like GitManager.get_commits_between output."""
+    return {'id': id, 'short_id': id[:7], 'message': msg, 'summary': msg,
+            'author': author, 'date': date}
+
+
+@pytest.fixture(scope="module")
+def repos_dir(tmp_path_factory):
+    """One repos directory for the whole module; it is emptied after each test."""
+    return tmp_path_factory.mktemp("repos")
+
+
+@pytest.fixture
+def patched_repo_class(monkeypatch):
+    """Replace the Repo class git_manager uses; monkeypatch restores it."""
+    repo_class = MagicMock()
+    monkeypatch.setattr('release_trucker.git_manager.Repo', repo_class)
+    return repo_class
+
+
+@pytest.fixture(scope="session")
+def real_repo(tmp_path_factory):
+    """
+    A small on-disk repository shared by every test that needs real git.
     
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.git_manager = GitManager(repos_dir=self.temp_dir)
+    History: v1.0.0 -> two commits on 'feature' -> merge into main -> v1.1.0.
+    Tests should take fresh_repo rather than this fixture so that any
+    working-tree changes are reset instead of re-creating the repository.
+    """
+    path = tmp_path_factory.mktemp("real_repo")
+    repo = Repo.init(path, initial_branch="main")
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Release Tracker Tests")
+        config.set_value("user", "email", "tests@example.com")
+    actor = Actor("Release Tracker Tests", "tests@example.com")
     
-    def teardown_method(self):
-        shutil.rmtree(self.temp_dir)
+    # Commits are sorted by date, so pin them one hour apart rather than
+    # relying on the wall clock
+    def commit_file(name, message, date):
+        (path / name).write_text(message)
+        repo.index.add([name])
+        return repo.index.commit(message, author=actor, committer=actor,
+                                 author_date=date, commit_date=date)
     
-    @patch('release_trucker.git_manager.Repo')
-    def test_get_or_update_repo_clone_new(self, mock_repo_class):
-        mock_repo = Mock()
-        mock_repo_class.clone_from.return_value = mock_repo
+    commit_file("README", "Initial commit", "2024-01-01T10:00:00+0000")
+    repo.create_tag("v1.0.0")
+    
+    repo.git.checkout("-b", "feature")
+    commit_file("feature.txt", "PROJ-1 Add feature", "2024-01-01T11:00:00+0000")
+    commit_file("fix.txt", "PROJ-2 Fix feature bug", "2024-01-01T12:00:00+0000")
+    
+    repo.git.checkout("main")
+    merge_date = "2024-01-01T13:00:00+0000"
+    repo.git.merge("feature", "--no-ff", "-m", "Merge branch 'feature'",
+                   env={"GIT_AUTHOR_DATE": merge_date, "GIT_COMMITTER_DATE": merge_date})
+    repo.create_tag("v1.1.0")
+    return repo
+
+
+@pytest.fixture
+def fresh_repo(real_repo):
+    """The shared real repository, reset to HEAD after each test."""
+    yield real_repo
+    real_repo.git.reset("--hard", "HEAD")
+    real_repo.git.clean("-fdx")
+
+
+class TestGitManager:
+    
+    @pytest.fixture(autouse=True)
+    def setup_git_manager(self, repos_dir):
+        self.temp_dir = repos_dir
+        self.project_name = "test-project"
+        self.repo_path = repos_dir / self.project_name
+        self.git_manager = GitManager(repos_dir=str(repos_dir))
+        yield
+        # Most tests only use mock repos; clear anything the others left behind
+        for entry in repos_dir.iterdir():
+            shutil.rmtree(entry)
+    
+    def test_get_or_update_repo_clone_new(self, patched_repo_class, mock_repo):
+        patched_repo_class.clone_from.return_value = mock_repo
         
         repo_url = "https://github.com/test/repo.git"
-        project_name = "test-project"
         
-        result = self.git_manager.get_or_update_repo(repo_url, project_name)
+        result = self.git_manager.get_or_update_repo(repo_url, self.project_name)
         
         assert result == mock_repo
-        mock_repo_class.clone_from.assert_called_once_with(
+        patched_repo_class.clone_from.assert_called_once_with(
             repo_url, 
-            Path(self.temp_dir) / project_name
+            self.repo_path
         )
     
-    @patch('release_trucker.git_manager.Repo')
-    def test_get_or_update_repo_update_existing_main(self, mock_repo_class):
-        project_name = "test-project"
-        repo_path = Path(self.temp_dir) / project_name
-        repo_path.mkdir()
+    @pytest.mark.parametrize("branch_name, fail_main", [
+        ("main", False),
+        ("master", True),
+    ])
+    def test_get_or_update_repo_update_existing(self, patched_repo_class, mock_repo,
+                                                branch_name, fail_main):
+        self.repo_path.mkdir()
         
-        mock_repo = Mock()
         mock_origin = Mock()
         mock_main_head = Mock()
-        
-        mock_repo.remotes.origin = mock_origin
-        mock_repo.heads.main = mock_main_head
-        mock_repo_class.return_value = mock_repo
-        
-        repo_url = "https://github.com/test/repo.git"
-        
-        result = self.git_manager.get_or_update_repo(repo_url, project_name)
-        
-        assert result == mock_repo
-        mock_origin.fetch.assert_called_once()
-        mock_main_head.checkout.assert_called_once()
-        mock_main_head.reset.assert_called_once_with('origin/main', index=True, working_tree=True)
-    
-    @patch('release_trucker.git_manager.Repo')
-    def test_get_or_update_repo_update_existing_master(self, mock_repo_class):
-        project_name = "test-project"
-        repo_path = Path(self.temp_dir) / project_name
-        repo_path.mkdir()
-        
-        mock_repo = Mock()
-        mock_origin = Mock()
         mock_master_head = Mock()
+        if fail_main:
+            mock_main_head.checkout.side_effect = Exception("No main branch")
         
         mock_repo.remotes.origin = mock_origin
-        # Mock main branch to raise exception on checkout, then on reset
-        mock_main_head = Mock()
-        mock_main_head.checkout.side_effect = Exception("No main branch")
         mock_repo.heads.main = mock_main_head
         mock_repo.heads.master = mock_master_head
-        mock_repo_class.return_value = mock_repo
+        patched_repo_class.return_value = mock_repo
         
         repo_url = "https://github.com/test/repo.git"
         
-        result = self.git_manager.get_or_update_repo(repo_url, project_name)
+        result = self.git_manager.get_or_update_repo(repo_url, self.project_name)
         
         assert result == mock_repo
         mock_origin.fetch.assert_called_once()
-        mock_master_head.checkout.assert_called_once()
-        mock_master_head.reset.assert_called_once_with('origin/master', index=True, working_tree=True)
+        head = mock_master_head if branch_name == "master" else mock_main_head
+        head.checkout.assert_called_once()
+        head.reset.assert_called_once_with(f'origin/{branch_name}', index=True, working_tree=True)
     
-    @patch('release_trucker.git_manager.Repo')
-    def test_get_or_update_repo_git_error(self, mock_repo_class):
-        mock_repo_class.clone_from.side_effect = GitCommandError("git clone", 1)
+    @pytest.mark.parametrize("error", GIT_ERRORS)
+    def test_get_or_update_repo_error(self, patched_repo_class, error):
+        patched_repo_class.clone_from.side_effect = error
         
         repo_url = "https://github.com/test/repo.git"
-        project_name = "test-project"
         
-        result = self.git_manager.get_or_update_repo(repo_url, project_name)
+        result = self.git_manager.get_or_update_repo(repo_url, self.project_name)
         
         assert result is None
     
-    def test_get_commits_between_success(self):
-        mock_repo = Mock()
-        mock_commit1 = Mock()
-        mock_commit1.hexsha = "abc123def456"
-        mock_commit1.message = "First commit\n"
-        mock_commit1.summary = "First commit"
-        mock_commit1.author = "John Doe"
-        mock_commit1.committed_datetime.isoformat.return_value = "2023-01-01T12:00:00"
-        
-        mock_commit2 = Mock()
-        mock_commit2.hexsha = "def456ghi789"
-        mock_commit2.message = "Second commit\n"
-        mock_commit2.summary = "Second commit"
-        mock_commit2.author = "Jane Smith"
-        mock_commit2.committed_datetime.isoformat.return_value = "2023-01-02T12:00:00"
-        
-        mock_repo.iter_commits.return_value = [mock_commit1, mock_commit2]
+    def test_get_commits_between_success(self, mock_repo):
+        mock_repo.iter_commits.return_value = list(SAMPLE_COMMITS)
         
         result = self.git_manager.get_commits_between(mock_repo, "from_commit", "to_commit")
         
@@ -124,35 +188,30 @@ class TestGitManager:
         
         mock_repo.iter_commits.assert_called_once_with("from_commit..to_commit")
     
-    def test_get_commits_between_git_error(self):
-        mock_repo = Mock()
-        mock_repo.iter_commits.side_effect = GitCommandError("git log", 1)
+    @pytest.mark.parametrize("error", GIT_ERRORS)
+    def test_get_commits_between_error(self, mock_repo, error):
+        mock_repo.iter_commits.side_effect = error
         
         result = self.git_manager.get_commits_between(mock_repo, "from_commit", "to_commit")
         
         assert result == []
     
-    def test_commit_exists_true(self):
-        mock_repo = Mock()
-        mock_commit = Mock()
-        mock_repo.commit.return_value = mock_commit
+    @pytest.mark.parametrize("side_effect, expected", [
+        (None, True),
+        (GitCommandError("git rev-parse", 128), False),
+        (Exception("Commit not found"), False),
+    ], ids=["exists", "git-error", "unexpected-error"])
+    def test_commit_exists(self, mock_repo, side_effect, expected):
+        mock_repo.commit.side_effect = side_effect
         
         result = self.git_manager.commit_exists(mock_repo, "abc123")
         
-        assert result is True
+        assert result is expected
         mock_repo.commit.assert_called_once_with("abc123")
     
-    def test_commit_exists_false(self):
-        mock_repo = Mock()
-        mock_repo.commit.side_effect = Exception("Commit not found")
-        
-        result = self.git_manager.commit_exists(mock_repo, "abc123")
-        
-        assert result is False
-    
     def test_cleanup_repos(self):
         # Create some test directories
-        test_repo_dir = Path(self.temp_dir) / "test-repo"
+        test_repo_dir = self.temp_dir / "test-repo"
         test_repo_dir.mkdir()
         
         # Verify directory exists
@@ -162,111 +221,61 @@ class TestGitManager:
         self.git_manager.cleanup_repos()
         
         # Verify directory is recreated empty
-        repos_dir = Path(self.temp_dir)
+        repos_dir = self.temp_dir
         assert repos_dir.exists()
         assert list(repos_dir.iterdir()) == []
     
-    def test_repos_dir_creation(self):
+    def test_repos_dir_creation(self, tmp_path):
         # Test with non-existent directory
-        new_temp_dir = Path(tempfile.mkdtemp())
-        
-        non_existent_repos_dir = new_temp_dir / "new_repos"
-        git_manager = GitManager(repos_dir=str(non_existent_repos_dir))
+        non_existent_repos_dir = tmp_path / "new_repos"
+        GitManager(repos_dir=str(non_existent_repos_dir))
         
         assert non_existent_repos_dir.exists()
-        
-        # Cleanup
-        shutil.rmtree(new_temp_dir)
-    
-    @patch('release_trucker.git_manager.Repo')
-    def test_get_or_update_repo_unexpected_error(self, mock_repo_class):
-        mock_repo_class.clone_from.side_effect = Exception("Unexpected error")
-        
-        repo_url = "https://github.com/test/repo.git"
-        project_name = "test-project"
-        
-        result = self.git_manager.get_or_update_repo(repo_url, project_name)
-        
-        assert result is None
-    
-    def test_get_commits_between_unexpected_error(self):
-        mock_repo = Mock()
-        mock_repo.iter_commits.side_effect = Exception("Unexpected error")
-        
-        result = self.git_manager.get_commits_between(mock_repo, "from_commit", "to_commit")
-        
-        assert result == []
-    
-    def test_resolve_commit_reference_with_commit_id(self):
-        mock_repo = Mock()
-        mock_commit = Mock()
-        mock_commit.hexsha = "abc123def456"
-        mock_repo.commit.return_value = mock_commit
-        
-        result = self.git_manager.resolve_commit_reference(mock_repo, "abc123")
-        
-        assert result == "abc123def456"
-        mock_repo.commit.assert_called_once_with("abc123")
     
-    def test_resolve_commit_reference_with_tag(self):
-        mock_repo = Mock()
-        mock_commit = Mock()
-        mock_commit.hexsha = "tag123abc456"
+    @pytest.mark.parametrize("reference, hexsha", [
+        ("abc123", "abc123def456"),
+        ("v1.2.0", "tag123abc456"),
+    ])
+    def test_resolve_commit_reference(self, mock_repo, reference, hexsha):
+        mock_commit = _git_commit(hexsha)
         mock_repo.commit.return_value = mock_commit
         
-        result = self.git_manager.resolve_commit_reference(mock_repo, "v1.2.0")
+        result = self.git_manager.resolve_commit_reference(mock_repo, reference)
         
-        assert result == "tag123abc456"
-        mock_repo.commit.assert_called_once_with("v1.2.0")
+        assert result == hexsha
+        mock_repo.commit.assert_called_once_with(reference)
     
-    def test_resolve_commit_reference_invalid_reference(self):
-        mock_repo = Mock()
-        mock_repo.commit.side_effect = Exception("Invalid reference")
+    @pytest.mark.parametrize("error", GIT_ERRORS)
+    def test_resolve_commit_reference_invalid_reference(self, mock_repo, error):
+        mock_repo.commit.side_effect = error
         
         result = self.git_manager.resolve_commit_reference(mock_repo, "invalid-ref")
         
         assert result is None
         mock_repo.commit.assert_called_once_with("invalid-ref")
     
-    def test_tag_exists_true(self):
-        mock_repo = Mock()
-        mock_tag1 = Mock()
-        mock_tag1.name = "v1.0.0"
-        mock_tag2 = Mock()
-        mock_tag2.name = "v2.0.0"
-        mock_repo.tags = [mock_tag1, mock_tag2]
-        
-        result = self.git_manager.tag_exists(mock_repo, "v1.0.0")
-        
-        assert result is True
-    
-    def test_tag_exists_false(self):
-        mock_repo = Mock()
-        mock_tag1 = Mock()
-        mock_tag1.name = "v1.0.0"
-        mock_repo.tags = [mock_tag1]
+    @pytest.mark.parametrize("tag_name, expected", [
+        ("v1.0.0", True),
+        ("v3.0.0", False),
+    ])
+    def test_tag_exists(self, mock_repo, tag_name, expected):
+        mock_repo.tags = (Tag("v1.0.0"), Tag("v2.0.0"))
         
-        result = self.git_manager.tag_exists(mock_repo, "v2.0.0")
+        result = self.git_manager.tag_exists(mock_repo, tag_name)
         
-        assert result is False
+        assert result is expected
     
-    def test_tag_exists_exception(self):
-        mock_repo = Mock()
-        mock_repo.tags = Mock(side_effect=Exception("Git error"))
+    @pytest.mark.parametrize("error", GIT_ERRORS)
+    def test_tag_exists_exception(self, mock_repo, error):
+        type(mock_repo).tags = PropertyMock(side_effect=error)
         
         result = self.git_manager.tag_exists(mock_repo, "v1.0.0")
         
         assert result is False
 
-    def test_get_commits_between_with_merge_expansion_disabled(self):
+    def test_get_commits_between_with_merge_expansion_disabled(self, mock_repo):
         """Test get_commits_between with merge expansion disabled"""
-        mock_repo = Mock()
-        mock_commit = Mock()
-        mock_commit.hexsha = "abc123def456"
-        mock_commit.message = "Merge pull request #123"
-        mock_commit.summary = "Merge pull request #123"
-        mock_commit.author = "GitHub"
-        mock_commit.committed_datetime.isoformat.return_value = "2023-01-01T12:00:00"
+        mock_commit = _git_commit("abc123def456", "Merge pull request #123", author="GitHub")
         
         mock_repo.iter_commits.return_value = [mock_commit]
         
@@ -278,43 +287,16 @@ class TestGitManager:
         # Should not call _expand_merge_commits
         assert 'is_merged_commit' not in result[0]
 
-    def test_expand_merge_commits_simple_merge(self):
+    def test_expand_merge_commits_simple_merge(self, mock_repo):
         """Test expansion of a simple merge commit"""
-        mock_repo = Mock()
-        
         # Mock merge commit
-        merge_commit = Mock()
-        merge_commit.hexsha = "merge123"
-        merge_commit.summary = "Merge pull request #123"
-        merge_commit.parents = [Mock(), Mock()]  # Two parents = merge commit
-        
-        # Mock feature commits
-        feature_commit1 = Mock()
-        feature_commit1.hexsha = "feature1"
-        feature_commit1.message = "Add new feature"
-        feature_commit1.summary = "Add new feature"
-        feature_commit1.author = "Developer"
-        feature_commit1.committed_datetime.isoformat.return_value = "2023-01-01T10:00:00"
-        
-        feature_commit2 = Mock()
-        feature_commit2.hexsha = "feature2"
-        feature_commit2.message = "Fix feature bug"
-        feature_commit2.summary = "Fix feature bug"
-        feature_commit2.author = "Developer"
-        feature_commit2.committed_datetime.isoformat.return_value = "2023-01-01T11:00:00"
+        merge_commit = _git_commit("merge123", "Merge pull request #123", parents=MERGE_PARENTS)  # Two parents = merge commit
         
         # Setup mocks
         mock_repo.commit.return_value = merge_commit
-        mock_repo.iter_commits.return_value = [feature_commit1, feature_commit2]
+        mock_repo.iter_commits.return_value = list(FEATURE_COMMITS)
         
-        commits_input = [{
-            'id': 'merge123',
-            'short_id': 'merge12',
-            'message': 'Merge pull request #123',
-            'author': 'GitHub',
-            'date': '2023-01-01T12:00:00',
-            'summary': 'Merge pull request #123'
-        }]
+        commits_input = [_commit_dict(id='merge123', msg='Merge pull request #123', author='GitHub')]
         
         result = self.git_manager._expand_merge_commits(mock_repo, commits_input, "baseline123")
         
@@ -325,25 +307,14 @@ class TestGitManager:
         merged_commits = [c for c in result if c.get('is_merged_commit')]
         assert len(merged_commits) >= 2
 
-    def test_expand_merge_commits_no_merge_commits(self):
+    def test_expand_merge_commits_no_merge_commits(self, mock_repo):
         """Test expansion when there are no merge commits"""
-        mock_repo = Mock()
-        
         # Mock regular commit (single parent)
-        regular_commit = Mock()
-        regular_commit.hexsha = "regular123"
-        regular_commit.parents = [Mock()]  # Single parent = regular commit
+        regular_commit = _git_commit("regular123")  # Single parent = regular commit
         
         mock_repo.commit.return_value = regular_commit
         
-        commits_input = [{
-            'id': 'regular123',
-            'short_id': 'regular1',
-            'message': 'Regular commit',
-            'author': 'Developer',
-            'date': '2023-01-01T12:00:00',
-            'summary': 'Regular commit'
-        }]
+        commits_input = [_commit_dict(id='regular123', msg='Regular commit', author='Developer')]
         
         result = self.git_manager._expand_merge_commits(mock_repo, commits_input, "baseline123")
         
@@ -352,27 +323,16 @@ class TestGitManager:
         assert result[0]['id'] == 'regular123'
         assert 'is_merged_commit' not in result[0]
 
-    def test_expand_merge_commits_git_error(self):
+    def test_expand_merge_commits_git_error(self, mock_repo):
         """Test expansion when git operations fail"""
-        mock_repo = Mock()
-        
         # Mock merge commit
-        merge_commit = Mock()
-        merge_commit.hexsha = "merge123"
-        merge_commit.parents = [Mock(), Mock()]  # Two parents = merge commit
+        merge_commit = _git_commit("merge123", parents=MERGE_PARENTS)  # Two parents = merge commit
         
         # Setup to fail on iter_commits
         mock_repo.commit.return_value = merge_commit
         mock_repo.iter_commits.side_effect = GitCommandError("git log failed", 1)
         
-        commits_input = [{
-            'id': 'merge123',
-            'short_id': 'merge12',
-            'message': 'Merge pull request #123',
-            'author': 'GitHub',
-            'date': '2023-01-01T12:00:00',
-            'summary': 'Merge pull request #123'
-        }]
+        commits_input = [_commit_dict(id='merge123', msg='Merge pull request #123', author='GitHub')]
         
         result = self.git_manager._expand_merge_commits(mock_repo, commits_input, "baseline123")
         
@@ -380,47 +340,53 @@ class TestGitManager:
         assert len(result) == 1
         assert result[0]['id'] == 'merge123'
 
-    def test_expand_merge_commits_duplicate_prevention(self):
+    def test_expand_merge_commits_duplicate_prevention(self, mock_repo):
         """Test that duplicate commits are prevented during expansion"""
-        mock_repo = Mock()
-        
         # Mock merge commit
-        merge_commit = Mock()
-        merge_commit.hexsha = "merge123"
-        merge_commit.parents = [Mock(), Mock()]
+        merge_commit = _git_commit("merge123", parents=MERGE_PARENTS)
         
         # Mock feature commit that's already in the original list
-        feature_commit = Mock()
-        feature_commit.hexsha = "feature1"  # Same as one in commits_input
-        feature_commit.message = "Feature commit"
-        feature_commit.summary = "Feature commit"
-        feature_commit.author = "Developer"
-        feature_commit.committed_datetime.isoformat.return_value = "2023-01-01T10:00:00"
+        # Same as one in commits_input
+        feature_commit = _git_commit("feature1", "Feature commit", date="2023-01-01T10:00:00")
         
         mock_repo.commit.return_value = merge_commit
         mock_repo.iter_commits.return_value = [feature_commit]
         
         commits_input = [
-            {
-                'id': 'merge123',
-                'short_id': 'merge12',
-                'message': 'Merge pull request #123',
-                'author': 'GitHub',
-                'date': '2023-01-01T12:00:00',
-                'summary': 'Merge pull request #123'
-            },
-            {
-                'id': 'feature1',  # Already in commits
-                'short_id': 'feature',
-                'message': 'Feature commit',
-                'author': 'Developer',
-                'date': '2023-01-01T10:00:00',
-                'summary': 'Feature commit'
-            }
+            _commit_dict(id='merge123', msg='Merge pull request #123', author='GitHub'),
+            # Already in commits
+            _commit_dict(id='feature1', msg='Feature commit', author='Developer',
+                         date='2023-01-01T10:00:00'),
         ]
         
         result = self.git_manager._expand_merge_commits(mock_repo, commits_input, "baseline123")
         
         # Should not duplicate the feature commit
         feature_commits = [c for c in result if c['id'] == 'feature1']
-        assert len(feature_commits) == 1
\ No newline at end of file
+        assert len(feature_commits) == 1
+
+
+class TestGitManagerRealRepo:
+    """Checks against a real repository; see the real_repo fixture."""
+    
+    @pytest.fixture(autouse=True)
+    def setup_git_manager(self, tmp_path):
+        self.git_manager = GitManager(repos_dir=str(tmp_path / "repos"))
+    
+    def test_get_commits_between_tags(self, fresh_repo):
+        result = self.git_manager.get_commits_between(fresh_repo, "v1.0.0", "v1.1.0")
+        
+        # Oldest first, following the pinned commit dates
+        assert [c['message'] for c in result] == [
+            "PROJ-1 Add feature",
+            "PROJ-2 Fix feature bug",
+            "Merge branch 'feature'",
+        ]
+        assert all(len(c['short_id']) == 8 for c in result)
+        # The merged commits are already in the range, so expansion adds nothing
+        assert not any(c.get('is_merged_commit') for c in result)
+    
+    def test_resolve_tag_and_tag_exists(self, fresh_repo):
+        assert self.git_manager.tag_exists(fresh_repo, "v1.1.0") is True
+        assert self.git_manager.tag_exists(fresh_repo, "v9.9.9") is False
+        assert self.git_manager.resolve_commit_reference(fresh_repo, "v1.1.0") == fresh_repo.head.commit.hexsha
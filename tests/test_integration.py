@@ -1,34 +1,86 @@
+import copy
+import json
+import re
+
 import pytest
-import tempfile
 import yaml
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch, MagicMock
 import responses
 
 from release_trucker.cli import cli
 from release_trucker.analyzer import ReleaseAnalyzer
 from release_trucker.config import load_config
 
+# Use libyaml's emitter when PyYAML was built with it
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
 
-@pytest.mark.integration
-class TestIntegration:
-    
-    def setup_method(self):
-        self.temp_dir = Path(tempfile.mkdtemp())
+
+# Commits between consecutive environments in test_end_to_end_analysis
+COMMITS_BY_RANGE = {
+    ("prod123", "pre456"): (
+        {'id': 'pre456', 'short_id': 'pre456ab', 'message': 'Pre commit',
+         'summary': 'Pre commit', 'author': 'Author 1', 'date': '2023-01-01T12:00:00'},
+    ),
+    ("pre456", "test789"): (
+        {'id': 'test789', 'short_id': 'test789c', 'message': 'Test commit',
+         'summary': 'Test commit', 'author': 'Author 2', 'date': '2023-01-02T12:00:00'},
+    ),
+    ("test789", "dev000"): (
+        {'id': 'dev000', 'short_id': 'dev000de', 'message': 'Dev commit',
+         'summary': 'Dev commit', 'author': 'Author 3', 'date': '2023-01-03T12:00:00'},
+    ),
+}
+
+
+def create_test_config(tmp_path, config_data):
+    config_file = tmp_path / "test_config.yaml"
+    with open(config_file, 'w') as f:
+        yaml.dump(config_data, f, Dumper=YAML_DUMPER)
+    return str(config_file)
+
+
+ACTUATOR_INFO_URL = re.compile(r'.*/actuator/info')
+
+
+def actuator_info(version, commit_id):
+    """Minimal Spring Boot /actuator/info body."""
+    return {'build': {'version': version}, 'git': {'commit': {'id': commit_id}}}
+
+
+def register_actuator_responses(payloads):
+    """
+    Serve every actuator request from one callback keyed by full URL.
     
-    def teardown_method(self):
-        import shutil
-        shutil.rmtree(self.temp_dir)
+    payloads maps each URL to (status, json_body); a None body sends no content.
+    """
+    def callback(request):
+        status, body = payloads[request.url]
+        return status, {}, json.dumps(body) if body is not None else ''
     
-    def create_test_config(self, config_data):
-        config_file = self.temp_dir / "test_config.yaml"
-        with open(config_file, 'w') as f:
-            yaml.dump(config_data, f)
-        return str(config_file)
+    responses.add_callback(responses.GET, ACTUATOR_INFO_URL, callback=callback,
+                           content_type='application/json')
+
+
+@pytest.fixture(scope="module")
+def shared_analyzer():
+    """One ReleaseAnalyzer for the module; its GitManager never touches disk."""
+    with patch('release_trucker.analyzer.GitManager'):
+        return ReleaseAnalyzer()
+
+
+@pytest.fixture
+def analyzer(shared_analyzer, make_git_manager_mock):
+    """A copy of the shared analyzer with a fresh GitManager mock, leaving the shared one untouched."""
+    analyzer = copy.copy(shared_analyzer)
+    analyzer.git_manager = make_git_manager_mock()
+    return analyzer
+
+
+@pytest.mark.integration
+class TestIntegration:
     
     @responses.activate
-    @patch('release_trucker.analyzer.GitManager')
-    def test_end_to_end_analysis(self, mock_git_manager_class):
+    def test_end_to_end_analysis(self, tmp_path, analyzer):
         # Setup test configuration
         config_data = {
             'projects': [
@@ -44,38 +96,18 @@ class TestIntegration:
                 }
             ]
         }
-        config_file = self.create_test_config(config_data)
+        config_file = create_test_config(tmp_path, config_data)
         
         # Setup API responses
-        responses.add(
-            responses.GET,
-            'https://prod-api.example.com/actuator/info',
-            json={'build': {'version': '1.0.0'}, 'git': {'commit': {'id': 'prod123'}}},
-            status=200
-        )
-        responses.add(
-            responses.GET,
-            'https://pre-api.example.com/actuator/info',
-            json={'build': {'version': '1.1.0'}, 'git': {'commit': {'id': 'pre456'}}},
-            status=200
-        )
-        responses.add(
-            responses.GET,
-            'https://test-api.example.com/actuator/info',
-            json={'build': {'version': '1.2.0'}, 'git': {'commit': {'id': 'test789'}}},
-            status=200
-        )
-        responses.add(
-            responses.GET,
-            'https://dev-api.example.com/actuator/info',
-            json={'build': {'version': '1.3.0'}, 'git': {'commit': {'id': 'dev000'}}},
-            status=200
-        )
+        register_actuator_responses({
+            'https://prod-api.example.com/actuator/info': (200, actuator_info('1.0.0', 'prod123')),
+            'https://pre-api.example.com/actuator/info': (200, actuator_info('1.1.0', 'pre456')),
+            'https://test-api.example.com/actuator/info': (200, actuator_info('1.2.0', 'test789')),
+            'https://dev-api.example.com/actuator/info': (200, actuator_info('1.3.0', 'dev000')),
+        })
         
         # Setup git manager mock
-        mock_git_manager = Mock()
-        mock_repo = Mock()
-        mock_git_manager.get_or_update_repo.return_value = mock_repo
+        mock_git_manager = analyzer.git_manager
         
         def resolve_commit_side_effect(repo, reference):
             # Return the original reference to maintain test expectations
@@ -83,23 +115,12 @@ class TestIntegration:
         
         mock_git_manager.resolve_commit_reference.side_effect = resolve_commit_side_effect
         
-        def get_commits_side_effect(repo, from_commit, to_commit, expand_merges=True):
-            if from_commit == "prod123" and to_commit == "pre456":
-                return [{'id': 'pre456', 'short_id': 'pre456ab', 'message': 'Pre commit', 
-                        'summary': 'Pre commit', 'author': 'Author 1', 'date': '2023-01-01T12:00:00'}]
-            elif from_commit == "pre456" and to_commit == "test789":
-                return [{'id': 'test789', 'short_id': 'test789c', 'message': 'Test commit',
-                        'summary': 'Test commit', 'author': 'Author 2', 'date': '2023-01-02T12:00:00'}]
-            elif from_commit == "test789" and to_commit == "dev000":
-                return [{'id': 'dev000', 'short_id': 'dev000de', 'message': 'Dev commit',
-                        'summary': 'Dev commit', 'author': 'Author 3', 'date': '2023-01-03T12:00:00'}]
-            return []
-        
-        mock_git_manager.get_commits_between.side_effect = get_commits_side_effect
-        mock_git_manager_class.return_value = mock_git_manager
-        
-        # Create analyzer and run analysis
-        analyzer = ReleaseAnalyzer()
+        mock_git_manager.get_commits_between.side_effect = (
+            lambda repo, from_commit, to_commit, expand_merges=True:
+                list(COMMITS_BY_RANGE.get((from_commit, to_commit), ()))
+        )
+        
+        # Run analysis
         config = load_config(config_file)
         
         result = analyzer.analyze_project(config.projects[0])
@@ -125,8 +146,7 @@ class TestIntegration:
         assert len(result.environments['DEV'].commits) == 1
     
     @responses.activate
-    @patch('release_trucker.analyzer.GitManager')
-    def test_partial_environment_failure(self, mock_git_manager_class):
+    def test_partial_environment_failure(self, tmp_path, analyzer):
         config_data = {
             'projects': [
                 {
@@ -139,30 +159,14 @@ class TestIntegration:
                 }
             ]
         }
-        config_file = self.create_test_config(config_data)
+        config_file = create_test_config(tmp_path, config_data)
         
         # Setup only PROD response, DEV will fail
-        responses.add(
-            responses.GET,
-            'https://prod-api.example.com/actuator/info',
-            json={'build': {'version': '1.0.0'}, 'git': {'commit': {'id': 'prod123'}}},
-            status=200
-        )
-        responses.add(
-            responses.GET,
-            'https://dev-api-broken.example.com/actuator/info',
-            status=500
-        )
+        register_actuator_responses({
+            'https://prod-api.example.com/actuator/info': (200, actuator_info('1.0.0', 'prod123')),
+            'https://dev-api-broken.example.com/actuator/info': (500, None),
+        })
         
-        # Setup git manager mock
-        mock_git_manager = Mock()
-        mock_repo = Mock()
-        mock_git_manager.get_or_update_repo.return_value = mock_repo
-        mock_git_manager.commit_exists.return_value = True
-        mock_git_manager.get_commits_between.return_value = []
-        mock_git_manager_class.return_value = mock_git_manager
-        
-        analyzer = ReleaseAnalyzer()
         config = load_config(config_file)
         
         result = analyzer.analyze_project(config.projects[0])
@@ -174,7 +178,7 @@ class TestIntegration:
         assert 'DEV' not in result.environments
     
     @responses.activate
-    def test_complete_failure_no_api_responses(self):
+    def test_complete_failure_no_api_responses(self, tmp_path, analyzer):
         config_data = {
             'projects': [
                 {
@@ -186,16 +190,13 @@ class TestIntegration:
                 }
             ]
         }
-        config_file = self.create_test_config(config_data)
+        config_file = create_test_config(tmp_path, config_data)
         
         # Setup failing API response
-        responses.add(
-            responses.GET,
-            'https://broken-api.example.com/actuator/info',
-            status=404
-        )
+        register_actuator_responses({
+            'https://broken-api.example.com/actuator/info': (404, None),
+        })
         
-        analyzer = ReleaseAnalyzer()
         config = load_config(config_file)
         
         result = analyzer.analyze_project(config.projects[0])
@@ -204,8 +205,7 @@ class TestIntegration:
         assert result is None
     
     @responses.activate  
-    @patch('release_trucker.analyzer.GitManager')
-    def test_git_repository_failure(self, mock_git_manager_class):
+    def test_git_repository_failure(self, tmp_path, analyzer, make_git_manager_mock):
         config_data = {
             'projects': [
                 {
@@ -217,22 +217,18 @@ class TestIntegration:
                 }
             ]
         }
-        config_file = self.create_test_config(config_data)
+        config_file = create_test_config(tmp_path, config_data)
         
         # Setup successful API response
-        responses.add(
-            responses.GET,
-            'https://prod-api.example.com/actuator/info',
-            json={'build': {'version': '1.0.0'}, 'git': {'commit': {'id': 'prod123'}}},
-            status=200
-        )
+        register_actuator_responses({
+            'https://prod-api.example.com/actuator/info': (200, actuator_info('1.0.0', 'prod123')),
+        })
         
         # Setup git manager to fail
-        mock_git_manager = Mock()
-        mock_git_manager.get_or_update_repo.return_value = None  # Simulate git failure
-        mock_git_manager_class.return_value = mock_git_manager
+        analyzer.git_manager = make_git_manager_mock(
+            **{'get_or_update_repo.return_value': None}  # Simulate git failure
+        )
         
-        analyzer = ReleaseAnalyzer()
         config = load_config(config_file)
         
         result = analyzer.analyze_project(config.projects[0])
@@ -241,8 +237,7 @@ class TestIntegration:
         assert result is None
     
     @responses.activate
-    @patch('release_trucker.analyzer.GitManager')
-    def test_multiple_projects_analysis(self, mock_git_manager_class):
+    def test_multiple_projects_analysis(self, tmp_path, analyzer):
         config_data = {
             'projects': [
                 {
@@ -257,31 +252,14 @@ class TestIntegration:
                 }
             ]
         }
-        config_file = self.create_test_config(config_data)
+        config_file = create_test_config(tmp_path, config_data)
         
         # Setup API responses for both services
-        responses.add(
-            responses.GET,
-            'https://service1-prod.example.com/actuator/info',
-            json={'build': {'version': '1.0.0'}, 'git': {'commit': {'id': 'svc1_prod'}}},
-            status=200
-        )
-        responses.add(
-            responses.GET,
-            'https://service2-prod.example.com/actuator/info',
-            json={'build': {'version': '2.0.0'}, 'git': {'commit': {'id': 'svc2_prod'}}},
-            status=200
-        )
+        register_actuator_responses({
+            'https://service1-prod.example.com/actuator/info': (200, actuator_info('1.0.0', 'svc1_prod')),
+            'https://service2-prod.example.com/actuator/info': (200, actuator_info('2.0.0', 'svc2_prod')),
+        })
         
-        # Setup git manager mock
-        mock_git_manager = Mock()
-        mock_repo = Mock()
-        mock_git_manager.get_or_update_repo.return_value = mock_repo
-        mock_git_manager.commit_exists.return_value = True
-        mock_git_manager.get_commits_between.return_value = []
-        mock_git_manager_class.return_value = mock_git_manager
-        
-        analyzer = ReleaseAnalyzer()
         config = load_config(config_file)
         
         results = []
@@ -297,7 +275,7 @@ class TestIntegration:
         assert results[0].environments['PROD'].version == '1.0.0'
         assert results[1].environments['PROD'].version == '2.0.0'
     
-    def test_config_validation(self):
+    def test_config_validation(self, tmp_path):
         # Test valid empty config scenarios
         valid_empty_configs = [
             {},  # Empty config
@@ -305,7 +283,7 @@ class TestIntegration:
         ]
         
         for empty_config in valid_empty_configs:
-            config_file = self.create_test_config(empty_config)
+            config_file = create_test_config(tmp_path, empty_config)
             config = load_config(config_file)
             assert len(config.projects) == 0
         
@@ -316,44 +294,40 @@ class TestIntegration:
         ]
         
         for invalid_config in invalid_project_configs:
-            config_file = self.create_test_config(invalid_config)
+            config_file = create_test_config(tmp_path, invalid_config)
             with pytest.raises(KeyError):
                 load_config(config_file)
 
 
 @pytest.mark.slow
+@pytest.mark.xdist_group("slow")
 class TestPerformanceIntegration:
     
     @responses.activate
-    @patch('release_trucker.analyzer.GitManager')
-    def test_large_commit_history(self, mock_git_manager_class):
+    def test_large_commit_history(self, analyzer, make_git_manager_mock):
         """Test handling of projects with large commit histories."""
         # Generate large number of mock commits
-        large_commit_list = []
-        for i in range(100):
-            large_commit_list.append({
-                'id': f'commit{i:03d}{"a" * 32}',
+        padding = "a" * 32
+        large_commit_list = [
+            {
+                'id': f'commit{i:03d}{padding}',
                 'short_id': f'commit{i:03d}',
                 'message': f'Commit message {i}',
                 'summary': f'Commit {i}',
                 'author': f'Author {i % 10}',
                 'date': f'2023-01-{(i % 30) + 1:02d}T12:00:00'
-            })
+            }
+            for i in range(100)
+        ]
         
-        mock_git_manager = Mock()
-        mock_repo = Mock()
-        mock_git_manager.get_or_update_repo.return_value = mock_repo
-        mock_git_manager.commit_exists.return_value = True
-        mock_git_manager.get_commits_between.return_value = large_commit_list
-        mock_git_manager_class.return_value = mock_git_manager
+        analyzer.git_manager = make_git_manager_mock(
+            **{'get_commits_between.return_value': large_commit_list}
+        )
         
         # Setup API response
-        responses.add(
-            responses.GET,
-            'https://large-service.example.com/actuator/info',
-            json={'build': {'version': '1.0.0'}, 'git': {'commit': {'id': 'large_commit'}}},
-            status=200
-        )
+        register_actuator_responses({
+            'https://large-service.example.com/actuator/info': (200, actuator_info('1.0.0', 'large_commit')),
+        })
         
         from release_trucker.config import ProjectConfig
         project_config = ProjectConfig(
@@ -362,7 +336,6 @@ class TestPerformanceIntegration:
             env={'DEV': 'https://large-service.example.com'}
         )
         
-        analyzer = ReleaseAnalyzer()
         result = analyzer.analyze_project(project_config)
         
         # Should handle large commit list without issues
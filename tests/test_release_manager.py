@@ -1,7 +1,7 @@
 import pytest
-import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
+from git import Actor, Repo
 
 from release_trucker.release_manager import ReleaseManager, VersionInfo
 from release_trucker.config import ProjectConfig
@@ -41,6 +41,12 @@ class TestVersionInfo:
         assert new_version.major == 1
         assert new_version.minor == 2
         assert new_version.patch == 4
+    
+    def test_version_is_immutable_and_hashable(self):
+        version = VersionInfo(1, 2, 3)
+        with pytest.raises(AttributeError):
+            version.major = 2
+        assert {version, VersionInfo(1, 2, 3)} == {version}
 
 
 class TestReleaseManager:
@@ -48,15 +54,13 @@ class TestReleaseManager:
     def setup_method(self):
         self.release_manager = ReleaseManager()
     
-    def test_validate_jira_ticket_valid(self):
-        valid_tickets = ["BWD-123", "AUTH-456", "FEAT-1", "PROJECT-9999"]
-        for ticket in valid_tickets:
-            assert self.release_manager.validate_jira_ticket(ticket)
+    @pytest.mark.parametrize("ticket", ["BWD-123", "AUTH-456", "FEAT-1", "PROJECT-9999"])
+    def test_validate_jira_ticket_valid(self, ticket):
+        assert self.release_manager.validate_jira_ticket(ticket)
     
-    def test_validate_jira_ticket_invalid(self):
-        invalid_tickets = ["bwd-123", "BWD123", "BWD-", "-123", "BWD-ABC", ""]
-        for ticket in invalid_tickets:
-            assert not self.release_manager.validate_jira_ticket(ticket)
+    @pytest.mark.parametrize("ticket", ["bwd-123", "BWD123", "BWD-", "-123", "BWD-ABC", ""])
+    def test_validate_jira_ticket_invalid(self, ticket):
+        assert not self.release_manager.validate_jira_ticket(ticket)
     
     def test_parse_version_valid(self):
         version = self.release_manager.parse_version("1.2.3")
@@ -65,10 +69,12 @@ class TestReleaseManager:
         assert version.minor == 2
         assert version.patch == 3
     
-    def test_parse_version_invalid(self):
-        invalid_versions = ["1.2", "1.2.3.4", "v1.2.3", "1.2.3-SNAPSHOT", ""]
-        for version_str in invalid_versions:
-            assert self.release_manager.parse_version(version_str) is None
+    def test_parse_version_memoized(self):
+        assert self.release_manager.parse_version("4.5.6") is ReleaseManager().parse_version("4.5.6")
+    
+    @pytest.mark.parametrize("version_str", ["1.2", "1.2.3.4", "v1.2.3", "1.2.3-SNAPSHOT", ""])
+    def test_parse_version_invalid(self, version_str):
+        assert self.release_manager.parse_version(version_str) is None
     
     @patch('release_trucker.release_manager.Repo')
     def test_get_all_tags_success(self, mock_repo_class):
@@ -110,41 +116,42 @@ class TestReleaseManager:
         assert tags == []
     
     @patch('release_trucker.release_manager.Repo')
-    def test_get_latest_version(self, mock_repo_class):
+    def test_close_closes_opened_repos(self, mock_repo_class):
         mock_repo = Mock()
         mock_repo_class.return_value = mock_repo
+        mock_repo.tags = []
+        self.release_manager.get_all_tags(Path("/fake/path"))
         
-        # Mock tags with valid semantic versioning
-        mock_tag1 = Mock()
-        mock_tag1.name = "1.0.0"
-        mock_tag2 = Mock()
-        mock_tag2.name = "2.1.0"
-        mock_tag3 = Mock()
-        mock_tag3.name = "1.5.0"
-        mock_tag4 = Mock()
-        mock_tag4.name = "2.0.0"
+        self.release_manager.close()
         
-        mock_repo.tags = [mock_tag1, mock_tag2, mock_tag3, mock_tag4]
+        mock_repo.close.assert_called_once()
+        # A later call opens the repository again
+        self.release_manager.get_all_tags(Path("/fake/path"))
+        assert mock_repo_class.call_count == 2
+    
+    @patch('release_trucker.release_manager.Repo')
+    def test_get_latest_version(self, mock_repo_class):
+        mock_repo = Mock()
+        mock_repo_class.return_value = mock_repo
+        
+        # git returns tags sorted by version, newest first
+        mock_repo.git.for_each_ref.return_value = "2.1.0\n2.0.0\n1.5.0\n1.0.0"
         
         latest = self.release_manager.get_latest_version(Path("/fake/path"))
         
         assert latest is not None
         assert str(latest) == "2.1.0"
+        mock_repo.git.for_each_ref.assert_called_once_with(
+            '--sort=-v:refname', '--format=%(refname:lstrip=2)', 'refs/tags/'
+        )
     
     @patch('release_trucker.release_manager.Repo')
     def test_get_latest_version_no_valid_tags(self, mock_repo_class):
         mock_repo = Mock()
         mock_repo_class.return_value = mock_repo
         
-        # Mock tags with invalid semantic versioning patterns
-        mock_tag1 = Mock()
-        mock_tag1.name = "invalid"
-        mock_tag2 = Mock()
-        mock_tag2.name = "v1.0.0"
-        mock_tag3 = Mock()
-        mock_tag3.name = "1.0.0-SNAPSHOT"
-        
-        mock_repo.tags = [mock_tag1, mock_tag2, mock_tag3]
+        # Only tags with invalid semantic versioning patterns
+        mock_repo.git.for_each_ref.return_value = "v1.0.0\ninvalid\n1.0.0-SNAPSHOT"
         
         latest = self.release_manager.get_latest_version(Path("/fake/path"))
         
@@ -155,17 +162,8 @@ class TestReleaseManager:
         mock_repo = Mock()
         mock_repo_class.return_value = mock_repo
         
-        # Mock tags with mix of valid and invalid semantic versioning patterns
-        mock_tag1 = Mock()
-        mock_tag1.name = "v1.0.0"  # Invalid (has 'v' prefix)
-        mock_tag2 = Mock()
-        mock_tag2.name = "2.1.0"   # Valid
-        mock_tag3 = Mock()
-        mock_tag3.name = "staging-release"  # Invalid
-        mock_tag4 = Mock()
-        mock_tag4.name = "1.5.0"   # Valid
-        
-        mock_repo.tags = [mock_tag1, mock_tag2, mock_tag3, mock_tag4]
+        # Mix of valid and invalid patterns; invalid ones may sort first
+        mock_repo.git.for_each_ref.return_value = "v1.0.0\nstaging-release\n2.1.0\n1.5.0"
         
         latest = self.release_manager.get_latest_version(Path("/fake/path"))
         
@@ -173,22 +171,35 @@ class TestReleaseManager:
         assert latest is not None
         assert str(latest) == "2.1.0"
     
+    def test_get_latest_version_sorts_numerically(self, tmp_path):
+        repo = Repo.init(tmp_path)
+        author = Actor("Developer", "dev@example.com")
+        repo.index.commit("Initial commit", author=author, committer=author)
+        for name in ("1.2.0", "1.10.0", "1.9.0", "release-5"):
+            repo.create_tag(name)
+        
+        assert self.release_manager.get_latest_version(tmp_path) == VersionInfo(1, 10, 0)
+        assert self.release_manager.get_highest_major_version(tmp_path) == 1
+    
+    def test_get_sorted_version_tags_with_branch_of_same_name(self, tmp_path):
+        repo = Repo.init(tmp_path)
+        author = Actor("Developer", "dev@example.com")
+        repo.index.commit("Initial commit", author=author, committer=author)
+        repo.create_tag("1.0.0")
+        repo.create_tag("2.0.0")
+        repo.create_head("2.0.0")
+        
+        # An ambiguous short name would come back as tags/2.0.0 and be dropped
+        assert self.release_manager.get_sorted_version_tags(tmp_path) == ["2.0.0", "1.0.0"]
+        assert self.release_manager.get_latest_version(tmp_path) == VersionInfo(2, 0, 0)
+    
     @patch('release_trucker.release_manager.Repo')
     def test_get_highest_major_version(self, mock_repo_class):
         mock_repo = Mock()
         mock_repo_class.return_value = mock_repo
         
-        # Mock tags with valid semantic versioning
-        mock_tag1 = Mock()
-        mock_tag1.name = "1.0.0"
-        mock_tag2 = Mock()
-        mock_tag2.name = "3.1.0"
-        mock_tag3 = Mock()
-        mock_tag3.name = "2.5.0"
-        mock_tag4 = Mock()
-        mock_tag4.name = "3.0.0"
-        
-        mock_repo.tags = [mock_tag1, mock_tag2, mock_tag3, mock_tag4]
+        # git returns tags sorted by version, newest first
+        mock_repo.git.for_each_ref.return_value = "3.1.0\n3.0.0\n2.5.0\n1.0.0"
         
         highest_major = self.release_manager.get_highest_major_version(Path("/fake/path"))
         
@@ -198,21 +209,38 @@ class TestReleaseManager:
     def test_get_highest_major_version_no_tags(self, mock_repo_class):
         mock_repo = Mock()
         mock_repo_class.return_value = mock_repo
-        mock_repo.tags = []
+        mock_repo.git.for_each_ref.return_value = ""
         
         highest_major = self.release_manager.get_highest_major_version(Path("/fake/path"))
         
         assert highest_major == 0
     
+    @patch('release_trucker.release_manager.Repo')
+    def test_repo_opened_once_per_path(self, mock_repo_class):
+        mock_repo_class.return_value.tags = []
+        mock_repo_class.return_value.git.for_each_ref.return_value = ""
+        
+        self.release_manager.get_all_tags(Path("/fake/path"))
+        self.release_manager.branch_exists(Path("/fake/path"), "main")
+        
+        mock_repo_class.assert_called_once_with(Path("/fake/path"))
+    
+    def test_scan_tags_reads_tags_once(self):
+        tags = ["v3.0", "2.0.1", "1.10.0", "1.2.0", "release-3"]
+        with patch.object(ReleaseManager, 'get_sorted_version_tags', return_value=tags) as mock_tags:
+            scan = self.release_manager._scan_tags(Path("/fake/path"))
+        
+        mock_tags.assert_called_once_with(Path("/fake/path"))
+        assert scan.latest == VersionInfo(2, 0, 1)
+        assert scan.highest_major == 2
+    
     @patch('release_trucker.release_manager.Repo')
     def test_branch_exists_local(self, mock_repo_class):
         mock_repo = Mock()
         mock_repo_class.return_value = mock_repo
         
         # Mock local branch
-        mock_head = Mock()
-        mock_head.name = "release/BWD-123"
-        mock_repo.heads = [mock_head]
+        mock_repo.git.for_each_ref.return_value = "refs/heads/release/BWD-123"
         
         exists = self.release_manager.branch_exists(Path("/fake/path"), "release/BWD-123")
         
@@ -223,17 +251,17 @@ class TestReleaseManager:
         mock_repo = Mock()
         mock_repo_class.return_value = mock_repo
         
-        # No local branches
-        mock_repo.heads = []
-        
-        # Mock remote branch
-        mock_remote_ref = Mock()
-        mock_remote_ref.name = "origin/release/BWD-123"
-        mock_repo.remotes.origin.refs = [mock_remote_ref]
+        # Only the remote branch exists
+        mock_repo.git.for_each_ref.return_value = "refs/remotes/origin/release/BWD-123"
         
         exists = self.release_manager.branch_exists(Path("/fake/path"), "release/BWD-123")
         
         assert exists is True
+        mock_repo.git.for_each_ref.assert_called_once_with(
+            '--format=%(refname)',
+            'refs/heads/release/BWD-123',
+            'refs/remotes/origin/release/BWD-123',
+        )
     
     @patch('release_trucker.release_manager.Repo')
     def test_branch_not_exists(self, mock_repo_class):
@@ -241,33 +269,36 @@ class TestReleaseManager:
         mock_repo_class.return_value = mock_repo
         
         # No local or remote branches
-        mock_repo.heads = []
-        mock_repo.remotes.origin.refs = []
+        mock_repo.git.for_each_ref.return_value = ""
         
         exists = self.release_manager.branch_exists(Path("/fake/path"), "release/BWD-123")
         
         assert exists is False
     
+    def test_branch_exists_ignores_nested_refs(self, tmp_path):
+        repo = Repo.init(tmp_path)
+        author = Actor("Developer", "dev@example.com")
+        repo.index.commit("Initial commit", author=author, committer=author)
+        repo.create_head("release/BWD-123")
+        
+        assert self.release_manager.branch_exists(tmp_path, "release/BWD-123") is True
+        assert self.release_manager.branch_exists(tmp_path, "release") is False
+    
     @patch('release_trucker.release_manager.Repo')
     def test_get_commits_since_last_tag_with_tag(self, mock_repo_class):
         mock_repo = Mock()
         mock_repo_class.return_value = mock_repo
         
-        # Mock tag with commit and valid semantic version name
-        mock_tag = Mock()
-        mock_tag.name = "1.0.0"  # Valid semantic version
-        mock_tag.commit.committed_date = 1000
-        mock_tag.commit.hexsha = "abc123"
-        mock_repo.tags = [mock_tag]
+        # One valid semantic version tag
+        mock_repo.git.for_each_ref.return_value = "1.0.0"
         
         # Mock commits since tag
-        mock_commits = [Mock() for _ in range(5)]
-        mock_repo.iter_commits.return_value = mock_commits
+        mock_repo.git.rev_list.return_value = "5"
         
         count = self.release_manager.get_commits_since_last_tag(Path("/fake/path"))
         
         assert count == 5
-        mock_repo.iter_commits.assert_called_once_with("abc123..HEAD")
+        mock_repo.git.rev_list.assert_called_once_with('--count', "refs/tags/1.0.0..HEAD")
     
     @patch('release_trucker.release_manager.Repo')
     def test_get_commits_since_last_tag_no_tags(self, mock_repo_class):
@@ -275,37 +306,31 @@ class TestReleaseManager:
         mock_repo_class.return_value = mock_repo
         
         # No tags
-        mock_repo.tags = []
+        mock_repo.git.for_each_ref.return_value = ""
         
         # Mock all commits
-        mock_commits = [Mock() for _ in range(10)]
-        mock_repo.iter_commits.return_value = mock_commits
+        mock_repo.git.rev_list.return_value = "10"
         
         count = self.release_manager.get_commits_since_last_tag(Path("/fake/path"))
         
         assert count == 10
-        mock_repo.iter_commits.assert_called_once_with("HEAD")
+        mock_repo.git.rev_list.assert_called_once_with('--count', "HEAD")
     
     @patch('release_trucker.release_manager.Repo')
     def test_get_commits_since_last_tag_with_remote_reference(self, mock_repo_class):
         mock_repo = Mock()
         mock_repo_class.return_value = mock_repo
         
-        # Mock tag with commit and valid semantic version name
-        mock_tag = Mock()
-        mock_tag.name = "1.0.0"  # Valid semantic version
-        mock_tag.commit.committed_date = 1000
-        mock_tag.commit.hexsha = "abc123"
-        mock_repo.tags = [mock_tag]
+        # One valid semantic version tag
+        mock_repo.git.for_each_ref.return_value = "1.0.0"
         
         # Mock commits since tag on remote branch
-        mock_commits = [Mock() for _ in range(7)]
-        mock_repo.iter_commits.return_value = mock_commits
+        mock_repo.git.rev_list.return_value = "7"
         
         count = self.release_manager.get_commits_since_last_tag(Path("/fake/path"), "origin/main")
         
         assert count == 7
-        mock_repo.iter_commits.assert_called_once_with("abc123..origin/main")
+        mock_repo.git.rev_list.assert_called_once_with('--count', "refs/tags/1.0.0..origin/main")
     
     @patch('release_trucker.release_manager.Repo')
     def test_get_commits_since_last_tag_no_tags_with_remote_reference(self, mock_repo_class):
@@ -313,16 +338,25 @@ class TestReleaseManager:
         mock_repo_class.return_value = mock_repo
         
         # No tags
-        mock_repo.tags = []
+        mock_repo.git.for_each_ref.return_value = ""
         
         # Mock all commits on remote branch
-        mock_commits = [Mock() for _ in range(15)]
-        mock_repo.iter_commits.return_value = mock_commits
+        mock_repo.git.rev_list.return_value = "15"
         
         count = self.release_manager.get_commits_since_last_tag(Path("/fake/path"), "origin/develop")
         
         assert count == 15
-        mock_repo.iter_commits.assert_called_once_with("origin/develop")
+        mock_repo.git.rev_list.assert_called_once_with('--count', "origin/develop")
+    
+    def test_get_commits_since_last_tag_real_repo(self, tmp_path):
+        repo = Repo.init(tmp_path)
+        author = Actor("Developer", "dev@example.com")
+        repo.index.commit("Initial commit", author=author, committer=author)
+        repo.create_tag("1.0.0")
+        for i in range(3):
+            repo.index.commit(f"Change {i}", author=author, committer=author)
+        
+        assert self.release_manager.get_commits_since_last_tag(tmp_path) == 3
     
     @patch('release_trucker.release_manager.Repo')
     def test_checkout_branch_existing(self, mock_repo_class):
@@ -454,7 +488,7 @@ class TestReleaseManager:
         assert release_info.changes_since_last_tag is True
         
         # Verify that change detection used the remote main branch
-        mock_commits.assert_called_with(Path("/fake/repo"), "origin/main")
+        mock_commits.assert_called_with(Path("/fake/repo"), "origin/main", {})
     
     @patch.object(ReleaseManager, 'validate_jira_ticket')
     @patch.object(ReleaseManager, 'checkout_branch')
@@ -491,4 +525,31 @@ class TestReleaseManager:
         assert release_info.changes_since_last_tag is True
         
         # Verify that change detection used the custom remote main branch
-        mock_commits.assert_called_with(Path("/fake/repo"), "origin/develop")
\ No newline at end of file
+        mock_commits.assert_called_with(Path("/fake/repo"), "origin/develop", {})
+    
+    @pytest.mark.parametrize("release_branch_exists", [True, False])
+    @patch.object(ReleaseManager, 'checkout_branch', return_value=True)
+    @patch.object(ReleaseManager, 'branch_exists')
+    @patch('release_trucker.release_manager.Repo')
+    def test_prepare_release_reads_tags_once(self, mock_repo_class, mock_branch_exists,
+                                             mock_checkout, release_branch_exists):
+        mock_repo = Mock()
+        mock_repo.working_dir = "/fake/repo"
+        mock_repo_class.return_value = mock_repo
+        mock_repo.git.for_each_ref.return_value = "2.1.0\n1.0.0"
+        mock_repo.git.rev_list.return_value = "4"
+        mock_branch_exists.return_value = release_branch_exists
+        self.release_manager.git_manager.get_or_update_repo = Mock(return_value=mock_repo)
+        
+        project = ProjectConfig(
+            name="test-project",
+            repoUrl="https://github.com/test/repo.git",
+            env={"PROD": "https://prod.example.com"},
+            main_branch="main"
+        )
+        
+        release_info = self.release_manager.prepare_release(project, "BWD-123")
+        
+        assert str(release_info.new_version) == ("2.2.0" if release_branch_exists else "3.0.0")
+        mock_repo.git.for_each_ref.assert_called_once()
+        mock_repo.git.rev_list.assert_called_once_with('--count', "refs/tags/2.1.0..origin/main")